@@ -0,0 +1,129 @@
+import threading
+import time
+
+from django.core.cache import caches
+
+from . import settings
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent calls sharing the same key: a single call runs,
+    the others wait for its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = {"event": threading.Event()}
+
+        if not leader:
+            call["event"].wait()
+
+            if "error" in call:
+                raise call["error"]
+
+            return call["result"]
+
+        try:
+            call["result"] = func()
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call["event"].set()
+
+        return call["result"]
+
+
+single_flight = SingleFlight()
+
+
+def get_cache():
+    if settings.SLUGGABLE_RESOLVE_CACHE is None:
+        return None
+
+    return caches[settings.SLUGGABLE_RESOLVE_CACHE]
+
+
+def _coalesce(key, func):
+    if settings.SLUGGABLE_SINGLE_FLIGHT:
+        return single_flight.do(key, func)
+
+    return func()
+
+
+def _wrap(value):
+    return (value, time.time() + settings.SLUGGABLE_RESOLVE_CACHE_TIMEOUT)
+
+
+def _get_timeout():
+    return (
+        settings.SLUGGABLE_RESOLVE_CACHE_TIMEOUT
+        + settings.SLUGGABLE_RESOLVE_CACHE_STALE_TIMEOUT
+    )
+
+
+def get_or_set(key, func):
+    """
+    Returns the cached result of ``func``, stale values are returned while
+    a single caller refreshes them.
+    """
+    cache = get_cache()
+
+    if cache is None:
+        return _coalesce(key, func)
+
+    entry = cache.get(key)
+
+    if entry is not None:
+        value, fresh_until = entry
+
+        if fresh_until > time.time():
+            return value
+
+        # another caller is refreshing the value, serve the stale one
+        if not cache.add(
+            "%s:refresh" % key, 1, settings.SLUGGABLE_RESOLVE_CACHE_TIMEOUT
+        ):
+            return value
+
+    def refresh():
+        value = func()
+
+        cache.set(key, _wrap(value), _get_timeout())
+
+        return value
+
+    try:
+        return _coalesce(key, refresh)
+    finally:
+        if entry is not None:
+            cache.delete("%s:refresh" % key)
+
+
+def set_many(values):
+    cache = get_cache()
+
+    if cache is not None:
+        cache.set_many(
+            dict((key, _wrap(value)) for key, value in values.items()), _get_timeout()
+        )
+
+
+def delete_many(keys):
+    cache = get_cache()
+
+    if cache is not None:
+        cache.delete_many(keys)
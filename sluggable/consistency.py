@@ -0,0 +1,134 @@
+from collections import namedtuple
+from itertools import groupby
+from operator import itemgetter
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+
+MISSING = "missing"
+MULTIPLE = "multiple"
+MISMATCH = "mismatch"
+ORPHANED = "orphaned"
+
+CATEGORIES = (MISSING, MULTIPLE, MISMATCH, ORPHANED)
+
+Inconsistency = namedtuple("Inconsistency", ["category", "object_id", "value", "slugs"])
+
+
+def get_shared_fields(model, field):
+    """
+    Returns the other sluggable fields of ``model`` storing their slugs in
+    the decider of ``field``.
+    """
+    return [
+        other
+        for other in model._meta.fields
+        if other is not field and getattr(other, "decider", None) is field.decider
+    ]
+
+
+def iter_inconsistencies(model, field, batch_size=2000):
+    """
+    Yields inconsistencies between the slugs of ``model`` and its decider.
+
+    Both tables are streamed ordered by object id and merged, memory does
+    not depend on their size. Fields sharing their decider with another
+    field of the model cannot be checked.
+    """
+    if get_shared_fields(model, field):
+        raise ValueError(
+            "%s.%s shares its decider with other fields"
+            % (model._meta.label, field.name)
+        )
+
+    objects = (
+        model._default_manager.order_by("pk")
+        .values_list("pk", field.attname)
+        .iterator(chunk_size=batch_size)
+    )
+
+    rows = (
+        field.decider.objects.filter_by_model(model)
+        .order_by("object_id", "pk")
+        .values_list("object_id", "slug", "redirect")
+        .iterator(chunk_size=batch_size)
+    )
+
+    groups = groupby(rows, key=itemgetter(0))
+
+    obj = next(objects, None)
+    group = next(groups, None)
+
+    while obj is not None or group is not None:
+        if group is None or (obj is not None and obj[0] < group[0]):
+            if obj[1]:
+                yield Inconsistency(MISSING, obj[0], obj[1], [])
+
+            obj = next(objects, None)
+        elif obj is None or group[0] < obj[0]:
+            slugs = [row[1] for row in group[1]]
+
+            yield Inconsistency(ORPHANED, group[0], None, slugs)
+
+            group = next(groups, None)
+        else:
+            value = obj[1]
+
+            slugs = [row[1] for row in group[1] if not row[2]]
+
+            if value:
+                if not slugs:
+                    yield Inconsistency(MISSING, obj[0], value, slugs)
+                elif len(slugs) > 1:
+                    yield Inconsistency(MULTIPLE, obj[0], value, slugs)
+                elif slugs[0] != value:
+                    yield Inconsistency(MISMATCH, obj[0], value, slugs)
+
+            obj = next(objects, None)
+            group = next(groups, None)
+
+
+def repair_inconsistencies(model, field, inconsistencies):
+    """
+    Repairs ``inconsistencies`` of ``model`` in a single transaction.
+
+    The model column is considered right: its slug becomes the current one
+    and orphaned slugs are deleted. Returns the inconsistencies which could
+    not be repaired because the slug is used by another object.
+    """
+    manager = field.decider.objects.for_write()
+
+    content_type = ContentType.objects.get_for_model(model)
+
+    failures = []
+
+    with transaction.atomic(using=manager.get_write_db()):
+        orphaned = [
+            item.object_id for item in inconsistencies if item.category == ORPHANED
+        ]
+
+        if orphaned:
+            manager.filter_by_model(model, object_id__in=orphaned).delete()
+
+            registry = manager.get_registry()
+
+            if registry is not None:
+                registry.objects.using(manager.get_write_db()).filter_by_model(
+                    model, object_id__in=orphaned
+                ).delete()
+
+        for item in inconsistencies:
+            if item.category == ORPHANED:
+                continue
+
+            try:
+                with transaction.atomic(using=manager.get_write_db()):
+                    manager.filter_by_obj_id(
+                        item.object_id, content_type=content_type, redirect=False
+                    ).exclude(slug=item.value).update(redirect=True)
+
+                    manager.update_slug(model(pk=item.object_id), item.value)
+            except IntegrityError:
+                failures.append(item)
+
+    return failures
@@ -27,6 +27,116 @@ class SluggableObjectDescriptor(object):
         setattr(instance, "%s_changed" % self.field.attname, True)
 
 
+class SluggableModelCoordinator(object):
+    """
+    Runs the signal handlers of every ``SluggableField`` of a model in a
+    single pass.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.fields = []
+
+        signals.post_init.connect(self.instance_post_init, sender=model)
+        signals.pre_save.connect(self.instance_pre_save, sender=model)
+        signals.post_save.connect(self.instance_post_save, sender=model)
+        signals.post_delete.connect(self.instance_post_delete, sender=model)
+
+    def instance_post_init(self, instance, **kwargs):
+        for field in self.fields:
+            field.instance_post_init(instance, **kwargs)
+
+    def instance_pre_save(self, instance, **kwargs):
+        if len(self.fields) == 1:
+            self.fields[0].instance_pre_save(instance, **kwargs)
+            return
+
+        candidates = []
+        slugs = {}
+
+        for field in self.fields:
+            slug = field.get_slug_candidate(instance)
+
+            if slug is not None:
+                candidates.append((field, slug))
+                slugs.setdefault(field.decider, []).append(slug)
+
+        # check every candidate of a decider with one query
+        used = dict(
+            (decider, decider.objects.get_used_slugs(values, obj=instance))
+            for decider, values in slugs.items()
+        )
+
+        assigned = dict((decider, set()) for decider in slugs)
+
+        for field, slug in candidates:
+            decider = field.decider
+
+            if slug in used[decider] or slug in assigned[decider]:
+                for slug in utils.iter_slug_candidates(
+                    slug, field.max_length, field.index_sep
+                ):
+                    if slug not in assigned[decider] and not (
+                        decider.objects.get_used_slugs([slug], obj=instance)
+                    ):
+                        break
+
+            assigned[decider].add(slug)
+
+            setattr(instance, field.name, slug)
+
+    def get_fields_by_decider(self):
+        """
+        Returns ``(decider, fields)`` pairs in the order fields are declared.
+        """
+        results = []
+
+        for field in self.fields:
+            for decider, fields in results:
+                if decider is field.decider:
+                    fields.append(field)
+                    break
+            else:
+                results.append((field.decider, [field]))
+
+        return results
+
+    def instance_post_save(self, instance, **kwargs):
+        for decider, fields in self.get_fields_by_decider():
+            if len(fields) == 1:
+                fields[0].instance_post_save(instance, **kwargs)
+                continue
+
+            # slugs of fields sharing a decider are written with one call so
+            # the object keeps a single current slug, the one of the first
+            # field, the slugs of the other fields redirect to it
+            changed = False
+            slugs = []
+
+            for field in fields:
+                if getattr(instance, "%s_changed" % field.name, False):
+                    changed = True
+
+                slug = getattr(instance, field.name)
+
+                if slug:
+                    slugs.append(slug)
+
+                setattr(instance, "%s_changed" % field.name, False)
+
+            if changed and slugs:
+                decider.objects.update_slug(
+                    instance,
+                    slugs[0],
+                    created=kwargs.get("created", False),
+                    aliases=slugs[1:],
+                )
+
+    def instance_post_delete(self, instance, **kwargs):
+        for decider, fields in self.get_fields_by_decider():
+            decider.objects.delete_by_obj(instance)
+
+
 class SluggableField(models.SlugField):
     descriptor_class = SluggableObjectDescriptor
 
@@ -44,10 +154,14 @@ class SluggableField(models.SlugField):
     def contribute_to_class(self, cls, name):
         super(SluggableField, self).contribute_to_class(cls, name)
 
-        signals.post_init.connect(self.instance_post_init, sender=cls)
-        signals.pre_save.connect(self.instance_pre_save, sender=cls)
-        signals.post_save.connect(self.instance_post_save, sender=cls)
-        signals.post_delete.connect(self.instance_post_delete, sender=cls)
+        coordinator = cls.__dict__.get("_sluggable_coordinator")
+
+        if coordinator is None:
+            coordinator = SluggableModelCoordinator(cls)
+
+            cls._sluggable_coordinator = coordinator
+
+        coordinator.fields.append(self)
 
         if self.decider:
             if not hasattr(self.decider, "sluggable_models"):
@@ -62,7 +176,10 @@ class SluggableField(models.SlugField):
         if instance.pk:
             setattr(instance, "%s_changed" % self.name, False)
 
-    def instance_pre_save(self, instance, *args, **kwargs):
+    def get_slug_candidate(self, instance):
+        """
+        Returns the slug to make unique if it has to be updated.
+        """
         original_value = value = self.value_from_object(instance)
 
         if self.always_update or (self.populate_from and not value):
@@ -72,8 +189,14 @@ class SluggableField(models.SlugField):
             original_value != value
             or getattr(instance, "%s_changed" % self.name, False)
         ):
-            slug = utils.crop_slug(self.slugify(value), self.max_length)
+            return utils.crop_slug(self.slugify(value), self.max_length)
+
+        return None
 
+    def instance_pre_save(self, instance, *args, **kwargs):
+        slug = self.get_slug_candidate(instance)
+
+        if slug is not None:
             slug = self.decider.objects.generate_unique_slug(
                 instance, slug, self.max_length, self.index_sep
             )
@@ -97,7 +220,7 @@ class SluggableField(models.SlugField):
         setattr(instance, "%s_changed" % self.name, False)
 
     def instance_post_delete(self, instance, **kwargs):
-        self.decider.objects.filter_by_obj(instance).delete()
+        self.decider.objects.delete_by_obj(instance)
 
     def get_prep_lookup(self, lookup_type, value):
         if hasattr(value, "value"):
@@ -110,3 +233,21 @@ class SluggableField(models.SlugField):
             return None
 
         return value
+
+
+class SlugHashField(models.BigIntegerField):
+    """
+    Stores the digest of the ``slug`` of its model, computed on save.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("editable", False)
+
+        super(SlugHashField, self).__init__(*args, **kwargs)
+
+    def pre_save(self, model_instance, add):
+        value = utils.get_slug_hash(model_instance.slug)
+
+        setattr(model_instance, self.attname, value)
+
+        return value
@@ -0,0 +1,52 @@
+from django.db import models
+from django.db.backends.utils import names_digest, split_identifier
+from django.db.models.functions import Lower
+
+try:
+    from django.contrib.postgres.indexes import OpClass
+except ImportError:  # Django < 4.1 or psycopg missing
+    OpClass = None
+
+
+class SlugPrefixIndex(models.Index):
+    """
+    Index on ``LOWER(slug)`` used by ``SlugQuerySet.prefix``, created with
+    the ``text_pattern_ops`` operator class on PostgreSQL so ``LIKE 'abc%'``
+    can use it whatever the collation of the database.
+    """
+
+    suffix = "pfx"
+
+    def __init__(self, *expressions, **kwargs):
+        if not expressions:
+            expressions = (Lower("slug"),)
+
+        name = kwargs.pop("name", "")
+
+        # expressions require a name, the real one is set from the model
+        super().__init__(*expressions, name=name or "slug_prefix", **kwargs)
+
+        self.name = name
+
+    def set_name_with_model(self, model):
+        _, table_name = split_identifier(model._meta.db_table)
+
+        self.name = "%s_%s_%s" % (
+            table_name[:19],
+            names_digest(table_name, "slug_prefix", length=6),
+            self.suffix,
+        )
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor == "postgresql" and OpClass is not None:
+            index = self.clone()
+            index.expressions = tuple(
+                OpClass(expression, name="text_pattern_ops")
+                for expression in self.expressions
+            )
+
+            return super(SlugPrefixIndex, index).create_sql(
+                model, schema_editor, using=using, **kwargs
+            )
+
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
@@ -0,0 +1,88 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from sluggable.consistency import (
+    CATEGORIES,
+    get_shared_fields,
+    iter_inconsistencies,
+    repair_inconsistencies,
+)
+
+
+class Command(BaseCommand):
+    help = "Checks that sluggable models and their deciders are consistent"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models", nargs="*", help="Sluggable models as app_label.ModelName"
+        )
+        parser.add_argument(
+            "--repair", action="store_true", help="Repair inconsistencies"
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if options["models"]:
+            models = [apps.get_model(label) for label in options["models"]]
+        else:
+            models = apps.get_models()
+
+        for model in models:
+            for field in model._meta.fields:
+                if getattr(field, "decider", None) is None:
+                    continue
+
+                if get_shared_fields(model, field):
+                    self.stderr.write(
+                        "%s.%s: skipped, %s is shared with other fields"
+                        % (model._meta.label, field.name, field.decider._meta.label)
+                    )
+                    continue
+
+                self.check_field(model, field, options)
+
+    def check_field(self, model, field, options):
+        counts = dict((category, 0) for category in CATEGORIES)
+
+        items = []
+        failures = []
+
+        for item in iter_inconsistencies(model, field, options["batch_size"]):
+            counts[item.category] += 1
+
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    "%s %s: %s (%s)"
+                    % (item.category, item.object_id, item.value, ", ".join(item.slugs))
+                )
+
+            if options["repair"]:
+                items.append(item)
+
+        # repair once the streams are consumed, their cursors are closed
+        for i in range(0, len(items), options["batch_size"]):
+            failures += repair_inconsistencies(
+                model, field, items[i : i + options["batch_size"]]
+            )
+
+        self.stdout.write(
+            "%s.%s: %s"
+            % (
+                model._meta.label,
+                field.name,
+                ", ".join(
+                    "%d %s" % (counts[category], category) for category in CATEGORIES
+                ),
+            )
+        )
+
+        if options["repair"]:
+            self.stdout.write(
+                "%s.%s: %d repaired, %d failed"
+                % (
+                    model._meta.label,
+                    field.name,
+                    sum(counts.values()) - len(failures),
+                    len(failures),
+                )
+            )
@@ -0,0 +1,82 @@
+import gzip
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class Command(BaseCommand):
+    help = "Streams the slugs of a decider as JSON lines"
+
+    def add_arguments(self, parser):
+        parser.add_argument("decider", help="Decider model as app_label.ModelName")
+        parser.add_argument(
+            "-o", "--output", help="Output file, compressed if ending with .gz"
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--database", help="Database to read from")
+
+    def handle(self, *args, **options):
+        decider = apps.get_model(options["decider"])
+
+        db = options["database"] or decider.objects.get_read_db()
+
+        output = options["output"]
+
+        if not output:
+            stream = self.stdout
+        elif output.endswith(".gz"):
+            stream = gzip.open(output, "wt")
+        else:
+            stream = open(output, "w")
+
+        try:
+            count = self.export(decider, db, stream, options["batch_size"])
+        finally:
+            if stream is not self.stdout:
+                stream.close()
+
+        if output:
+            self.stdout.write("Exported %d slugs" % count)
+
+    def export(self, decider, db, stream, batch_size):
+        encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+        rows = (
+            decider.objects.get_queryset()
+            .using(db)
+            .order_by("pk")
+            .values_list("content_type_id", "object_id", "slug", "redirect", "created")
+            .iterator(chunk_size=batch_size)
+        )
+
+        content_types = set()
+
+        count = 0
+
+        for row in rows:
+            content_type_id = row[0]
+
+            # content types are declared by natural key before their first use
+            if content_type_id not in content_types:
+                content_type = ContentType.objects.db_manager(db).get_for_id(
+                    content_type_id
+                )
+
+                declaration = {
+                    "content_type": [content_type_id] + list(content_type.natural_key())
+                }
+
+                stream.write(encoder.encode(declaration) + "\n")
+
+                content_types.add(content_type_id)
+
+            # keep microseconds, DjangoJSONEncoder truncates them
+            row = row[:4] + (row[4].isoformat(),)
+
+            stream.write(encoder.encode(row) + "\n")
+
+            count += 1
+
+        return count
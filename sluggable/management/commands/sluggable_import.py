@@ -0,0 +1,145 @@
+import gzip
+import json
+import sys
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from django.utils.dateparse import parse_datetime
+
+
+class Command(BaseCommand):
+    help = "Loads slugs exported with sluggable_export into a decider"
+
+    def add_arguments(self, parser):
+        parser.add_argument("decider", help="Decider model as app_label.ModelName")
+        parser.add_argument(
+            "-i", "--input", help="Input file, decompressed if ending with .gz"
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--database", help="Database to write to")
+        parser.add_argument(
+            "--ignore-conflicts",
+            action="store_true",
+            help="Skip slugs already in the decider instead of aborting",
+        )
+
+    def handle(self, *args, **options):
+        decider = apps.get_model(options["decider"])
+
+        db = options["database"] or decider.objects.get_write_db()
+
+        path = options["input"]
+
+        if not path:
+            stream = sys.stdin
+        elif path.endswith(".gz"):
+            stream = gzip.open(path, "rt")
+        else:
+            stream = open(path)
+
+        try:
+            count = self.load(
+                decider,
+                db,
+                stream,
+                options["batch_size"],
+                options["ignore_conflicts"],
+            )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        self.stdout.write("Imported %d slugs" % count)
+
+    def load(self, decider, db, stream, batch_size, ignore_conflicts=False):
+        content_types = {}
+
+        count = 0
+        batch = []
+
+        for line in stream:
+            data = json.loads(line)
+
+            if isinstance(data, dict):
+                content_type_id, app_label, model = data["content_type"]
+
+                content_types[content_type_id] = (
+                    ContentType.objects.db_manager(db)
+                    .get_by_natural_key(app_label, model)
+                    .pk
+                )
+
+                continue
+
+            content_type_id, object_id, slug, redirect, created = data
+
+            batch.append(
+                decider(
+                    content_type_id=content_types[content_type_id],
+                    object_id=object_id,
+                    slug=slug,
+                    redirect=redirect,
+                    created=parse_datetime(created),
+                )
+            )
+
+            if len(batch) >= batch_size:
+                count += self.insert(decider, db, batch, count, ignore_conflicts)
+                batch = []
+
+        if batch:
+            count += self.insert(decider, db, batch, count, ignore_conflicts)
+
+        return count
+
+    def insert(self, decider, db, batch, count, ignore_conflicts):
+        qs = decider.objects.get_queryset().using(db)
+
+        def get_pks():
+            return dict(
+                ((slug, content_type_id, object_id), pk)
+                for slug, content_type_id, object_id, pk in qs.filter(
+                    slug__in=[instance.slug for instance in batch]
+                ).values_list("slug", "content_type_id", "object_id", "pk")
+            )
+
+        # auto_now_add overwrites created on insert, the exported dates are
+        # restored on the rows of this batch once inserted
+        dates = [instance.created for instance in batch]
+
+        try:
+            with transaction.atomic(using=db):
+                # rows skipped by ignore_conflicts are neither counted nor
+                # updated
+                existing = set(get_pks()) if ignore_conflicts else set()
+
+                qs.bulk_create(batch, ignore_conflicts=ignore_conflicts)
+
+                pks = get_pks()
+
+                instances = []
+
+                for instance, created in zip(batch, dates):
+                    key = (instance.slug, instance.content_type_id, instance.object_id)
+
+                    if key in existing:
+                        continue
+
+                    existing.add(key)
+
+                    instance.created = created
+                    instance.pk = pks.get(key)
+
+                    if instance.pk is not None:
+                        instances.append(instance)
+
+                qs.bulk_update(instances, ["created"])
+        except IntegrityError as e:
+            raise CommandError(
+                "%s, %d slugs were imported before this batch, "
+                "use --ignore-conflicts to skip existing slugs" % (e, count)
+            )
+
+        return len(instances)
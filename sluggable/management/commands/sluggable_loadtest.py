@@ -0,0 +1,285 @@
+import random
+import threading
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, connections, router
+from django.db.models import Count
+
+from sluggable import settings
+from sluggable.consistency import CATEGORIES, iter_inconsistencies
+from sluggable.profiling import profile_slug_queries
+
+OPERATIONS = ("create", "rename", "delete", "resolve")
+
+
+def percentile(values, percent):
+    if not values:
+        return 0
+
+    values = sorted(values)
+
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs concurrent creates, renames, deletes and resolutions against "
+        "a sluggable model and checks invariants"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Sluggable model as app_label.ModelName")
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument(
+            "--operations", type=int, default=500, help="Operations per worker"
+        )
+        parser.add_argument(
+            "--mix",
+            default="create=40,rename=30,delete=10,resolve=20",
+            help="Weights of operations",
+        )
+        parser.add_argument(
+            "--names",
+            type=int,
+            default=50,
+            help="Number of distinct names, fewer names means more collisions",
+        )
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--cache", help="Cache alias used to cache resolutions")
+        parser.add_argument(
+            "--single-flight", action="store_true", help="Coalesce resolutions"
+        )
+
+    def handle(self, *args, **options):
+        model = apps.get_model(options["model"])
+
+        fields = [
+            field
+            for field in model._meta.fields
+            if getattr(field, "decider", None) is not None
+        ]
+
+        if not fields:
+            raise CommandError("%s has no sluggable field" % model._meta.label)
+
+        self.model = model
+        self.field = fields[0]
+
+        try:
+            mix = dict(
+                (name, int(weight))
+                for name, weight in (
+                    item.split("=") for item in options["mix"].split(",")
+                )
+            )
+        except ValueError:
+            raise CommandError(
+                "Invalid --mix %r, expected operation=weight pairs separated by "
+                "commas" % options["mix"]
+            )
+
+        unknown = set(mix) - set(OPERATIONS)
+
+        if unknown:
+            raise CommandError("Unknown operations: %s" % ", ".join(sorted(unknown)))
+
+        self.prepare_database()
+
+        if options["cache"]:
+            settings.SLUGGABLE_RESOLVE_CACHE = options["cache"]
+
+        if options["single_flight"]:
+            settings.SLUGGABLE_SINGLE_FLIGHT = True
+
+        self.names = ["Load test %d" % i for i in range(options["names"])]
+        self.pks = list(model._default_manager.values_list("pk", flat=True))
+        self.lock = threading.Lock()
+
+        seed = options["seed"]
+
+        if seed is None:
+            seed = random.randrange(2**32)
+
+        self.stats = []
+
+        threads = [
+            threading.Thread(
+                target=self.worker,
+                args=(random.Random(seed + i), mix, options["operations"]),
+            )
+            for i in range(options["workers"])
+        ]
+
+        start = time.perf_counter()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        duration = time.perf_counter() - start
+
+        self.report(duration, seed)
+
+    def prepare_database(self):
+        db = router.db_for_write(self.field.decider)
+
+        connection = connections[db]
+
+        if connection.vendor == "sqlite":
+            if connection.is_in_memory_db():
+                raise CommandError("An in-memory database cannot be shared by workers")
+
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA journal_mode=WAL")
+
+    def worker(self, rng, mix, operations):
+        stats = dict(
+            (name, {"latencies": [], "integrity_errors": 0, "errors": 0, "queries": 0})
+            for name in OPERATIONS
+        )
+
+        names, weights = zip(*mix.items())
+
+        try:
+            for i in range(operations):
+                name = rng.choices(names, weights)[0]
+
+                start = time.perf_counter()
+
+                try:
+                    with profile_slug_queries() as profile:
+                        getattr(self, "run_%s" % name)(rng)
+                except IntegrityError:
+                    stats[name]["integrity_errors"] += 1
+                except Exception:
+                    stats[name]["errors"] += 1
+
+                stats[name]["latencies"].append(time.perf_counter() - start)
+                # queries of the command itself, e.g. fetching the object to
+                # rename, are not attributed to sluggable
+                stats[name]["queries"] += len(profile.get_queries())
+        finally:
+            connections.close_all()
+
+        with self.lock:
+            self.stats.append(stats)
+
+    def get_source(self):
+        populate_from = self.field.populate_from
+
+        if isinstance(populate_from, str):
+            return populate_from
+
+        return self.field.name
+
+    def pick(self, rng):
+        with self.lock:
+            if not self.pks:
+                return None
+
+            return rng.choice(self.pks)
+
+    def run_create(self, rng):
+        obj = self.model._default_manager.create(
+            **{self.get_source(): rng.choice(self.names)}
+        )
+
+        with self.lock:
+            self.pks.append(obj.pk)
+
+    def run_rename(self, rng):
+        pk = self.pick(rng)
+
+        if pk is None:
+            return
+
+        try:
+            obj = self.model._default_manager.get(pk=pk)
+        except self.model.DoesNotExist:
+            return
+
+        setattr(obj, self.field.name, self.field.slugify(rng.choice(self.names)))
+
+        obj.save()
+
+    def run_delete(self, rng):
+        pk = self.pick(rng)
+
+        if pk is None:
+            return
+
+        with self.lock:
+            if pk in self.pks:
+                self.pks.remove(pk)
+
+        self.model._default_manager.filter(pk=pk).delete()
+
+    def run_resolve(self, rng):
+        slug = self.field.slugify(rng.choice(self.names))
+
+        self.field.decider.objects.resolve(slug)
+
+    def report(self, duration, seed):
+        total = 0
+
+        self.stdout.write(
+            "%-10s %8s %10s %10s %10s %8s %8s"
+            % ("operation", "count", "p50 ms", "p99 ms", "queries", "integ.", "errors")
+        )
+
+        for name in OPERATIONS:
+            latencies = []
+            integrity_errors = errors = queries = 0
+
+            for stats in self.stats:
+                latencies += stats[name]["latencies"]
+                integrity_errors += stats[name]["integrity_errors"]
+                errors += stats[name]["errors"]
+                queries += stats[name]["queries"]
+
+            total += len(latencies)
+
+            self.stdout.write(
+                "%-10s %8d %10.2f %10.2f %10.2f %8d %8d"
+                % (
+                    name,
+                    len(latencies),
+                    percentile(latencies, 50) * 1000,
+                    percentile(latencies, 99) * 1000,
+                    queries / float(len(latencies) or 1),
+                    integrity_errors,
+                    errors,
+                )
+            )
+
+        self.stdout.write(
+            "%d operations in %.2fs, %.1f ops/s (seed %d)"
+            % (total, duration, total / duration, seed)
+        )
+
+        counts = dict((category, 0) for category in CATEGORIES)
+
+        for item in iter_inconsistencies(self.model, self.field):
+            counts[item.category] += 1
+
+        duplicates = (
+            self.model._default_manager.exclude(**{self.field.attname: None})
+            .values(self.field.attname)
+            .annotate(count=Count("pk"))
+            .filter(count__gt=1)
+            .count()
+        )
+
+        self.stdout.write(
+            "invariant violations: %s, %d duplicate slugs"
+            % (
+                ", ".join(
+                    "%d %s" % (counts[category], category) for category in CATEGORIES
+                ),
+                duplicates,
+            )
+        )
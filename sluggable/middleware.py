@@ -0,0 +1,61 @@
+from django.apps import apps
+from django.http import HttpResponsePermanentRedirect
+from django.urls import Resolver404, resolve, reverse
+
+from . import settings
+
+
+class SlugRedirectMiddleware(object):
+    """
+    Permanently redirects 404 responses of URLs using a previous slug to the
+    URL using the current slug, for URL names listed in
+    ``SLUGGABLE_REDIRECT_URLS``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.status_code != 404:
+            return response
+
+        return self.get_redirect(request) or response
+
+    def get_redirect(self, request):
+        try:
+            match = resolve(request.path_info, getattr(request, "urlconf", None))
+        except Resolver404:
+            return None
+
+        config = settings.SLUGGABLE_REDIRECT_URLS.get(match.view_name)
+
+        if config is None:
+            return None
+
+        decider, kwarg = config
+
+        slug = match.kwargs.get(kwarg)
+
+        if not slug:
+            return None
+
+        if isinstance(decider, str):
+            decider = apps.get_model(decider)
+
+        canonical = decider.objects.get_canonical_slug(slug)
+
+        if canonical is None or canonical == slug:
+            return None
+
+        url = reverse(
+            match.view_name,
+            kwargs=dict(match.kwargs, **{kwarg: canonical}),
+            urlconf=getattr(request, "urlconf", None),
+        )
+
+        if request.META.get("QUERY_STRING"):
+            url = "%s?%s" % (url, request.META["QUERY_STRING"])
+
+        return HttpResponsePermanentRedirect(url)
@@ -1,6 +1,15 @@
+import heapq
+import itertools
+import time
+
+from contextlib import contextmanager
+
 import django
 
-from django.db import models
+from django.apps import apps
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.functions import Lower
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 
@@ -10,13 +19,34 @@ except ImportError:
     from django.utils.translation import gettext_lazy as _  # noqa
 
 from django.db.models.query import QuerySet
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 
 
-from .utils import get_obj_id, generate_unique_slug
+from .reservations import get_reservation_store
+from . import cache
+from .fields import SlugHashField
+from .indexes import SlugPrefixIndex
+from .utils import crop_slug, get_obj_id, get_slug_hash, generate_unique_slug
 from . import settings
 
 
+def get_reservation_token(obj):
+    """
+    Returns the token of the slug reservation held by ``obj``, set it as
+    ``obj.slug_reservation_token`` before saving ``obj``.
+    """
+    return getattr(obj, "slug_reservation_token", None)
+
+
+def has_slug_hash(model):
+    try:
+        model._meta.get_field("slug_hash")
+    except FieldDoesNotExist:
+        return False
+
+    return True
+
+
 class SlugQuerySet(QuerySet):
     def filter_by_obj(self, obj, **kwargs):
         content_type = kwargs.pop(
@@ -42,22 +72,330 @@ class SlugQuerySet(QuerySet):
 
         return self.filter(content_type_id=get_obj_id(content_type), **kwargs)
 
+    def filter_by_slug(self, slug, iexact=False):
+        """
+        Filters on ``slug``, probing ``slug_hash`` first when the decider
+        has one.
+        """
+        qs = self
+
+        if iexact:
+            # LOWER(slug) is indexed by SlugPrefixIndex, UPPER(slug) is not
+            qs = qs.alias(slug_lower=Lower("slug"))
+            kwargs = {"slug_lower": slug.lower()}
+        else:
+            kwargs = {"slug": slug}
+
+        if has_slug_hash(self.model):
+            kwargs["slug_hash"] = get_slug_hash(slug)
+
+        return qs.filter(**kwargs)
+
+    def filter_by_slugs(self, slugs, iexact=False):
+        slugs = list(slugs)
+
+        if iexact:
+            qs = self.alias(slug_lower=Lower("slug")).filter(
+                slug_lower__in=[slug.lower() for slug in slugs]
+            )
+        else:
+            qs = self.filter(slug__in=slugs)
+
+        if has_slug_hash(self.model):
+            qs = qs.filter(slug_hash__in=[get_slug_hash(slug) for slug in slugs])
+
+        return qs
+
+    def filter_by_unique_slug(self, slug):
+        """
+        Filters on the rows ``slug`` would conflict with, the ones sharing
+        its digest when the decider has a ``slug_hash``.
+        """
+        return self.filter_by_unique_slugs([slug])
+
+    def filter_by_unique_slugs(self, slugs):
+        if has_slug_hash(self.model):
+            # slug_hash is the unique column, case variants share a digest
+            # when slugs are not case sensitive
+            return self.filter(slug_hash__in=[get_slug_hash(slug) for slug in slugs])
+
+        return self.filter(slug__in=slugs)
+
+    def prefix(self, value, after=None, limit=None):
+        """
+        Returns slugs starting with ``value`` ordered by slug, pass the last
+        slug of the previous page as ``after`` to retrieve the next one.
+        """
+        if settings.SLUGGABLE_CASE_SENSITIVE:
+            # uses the index of the slug column (its "_like" index on PostgreSQL)
+            qs = self.filter(slug__startswith=value)
+
+            if after is not None:
+                qs = qs.filter(slug__gt=after)
+
+            qs = qs.order_by("slug")
+        else:
+            # uses SlugPrefixIndex
+            qs = self.alias(slug_lower=Lower("slug")).filter(
+                slug_lower__startswith=value.lower()
+            )
+
+            if after is not None:
+                # slugs only differing by case share the same key, pages are
+                # ordered on (slug_lower, slug) to not skip them
+                qs = qs.filter(
+                    Q(slug_lower__gt=after.lower())
+                    | Q(slug_lower=after.lower(), slug__gt=after)
+                )
+
+            qs = qs.order_by("slug_lower", "slug")
+
+        if limit is not None:
+            qs = qs[:limit]
+
+        return qs
+
+
+# (decider, content type, object id) or ("slug", slug) -> deadline of the
+# read-your-writes window
+_recent_writes = {}
+
 
 class SlugManager(models.Manager):
+    # disabled on copies of the manager of a partition, the decider
+    # delegating to it writes the resolution cache
+    cache_writes = True
+
     def get_queryset(self):
-        return SlugQuerySet(self.model)
+        return SlugQuerySet(self.model, using=self._db)
 
     if django.VERSION < (1, 6):
         get_query_set = get_queryset
 
-    def filter_by_obj(self, *args, **kwargs):
-        return self.get_queryset().filter_by_obj(*args, **kwargs)
+    def get_partition(self, obj=None, content_type=None):
+        """
+        Returns the decider model storing slugs of ``obj`` (or ``content_type``)
+        according to ``partitions``, defaults to the decider itself.
+        """
+        partitions = self.model.partitions
+
+        if not partitions:
+            return self.model
+
+        if content_type is None:
+            content_type = ContentType.objects.get_for_model(obj)
+        elif not isinstance(content_type, ContentType):
+            content_type = ContentType.objects.get_for_id(content_type)
+
+        partition = partitions.get(
+            "%s.%s" % (content_type.app_label, content_type.model)
+        )
 
-    def filter_by_obj_id(self, *args, **kwargs):
-        return self.get_queryset().filter_by_obj_id(*args, **kwargs)
+        if partition is None:
+            return self.model
 
-    def filter_by_model(self, *args, **kwargs):
-        return self.get_queryset().filter_by_model(*args, **kwargs)
+        if isinstance(partition, str):
+            partition = apps.get_model(partition)
+
+        return partition
+
+    def get_read_db(self, content_type=None, obj_id=None, slug=None):
+        """
+        Returns the database alias used for reads, the write database is used
+        while the object (or ``slug``) is in its read-your-writes window.
+
+        Returns ``None`` when neither applies so querysets are left to the
+        database routers, e.g. ``delete()`` still goes to ``db_for_write``.
+        """
+        if self._db:
+            return self._db
+
+        if _recent_writes:
+            keys = []
+
+            if content_type is not None:
+                keys.append(self._get_write_key(content_type, obj_id))
+
+            if slug is not None:
+                keys.append(self._get_slug_write_key(slug))
+
+            for key in keys:
+                deadline = _recent_writes.get(key)
+
+                if deadline is None:
+                    continue
+
+                if deadline > time.monotonic():
+                    return self.get_write_db()
+
+                _recent_writes.pop(key, None)
+
+        return settings.SLUGGABLE_READ_DATABASE
+
+    def get_write_db(self):
+        if self._db:
+            return self._db
+
+        return settings.SLUGGABLE_WRITE_DATABASE or router.db_for_write(self.model)
+
+    def for_write(self):
+        """
+        Returns a manager pinned to the write database.
+        """
+        return self.db_manager(self.get_write_db())
+
+    def _get_write_key(self, content_type, obj_id):
+        return (self.model._meta.label_lower, get_obj_id(content_type), obj_id)
+
+    def _get_slug_write_key(self, slug):
+        # slugs are not bound to a decider, partitions share their namespace
+        if not settings.SLUGGABLE_CASE_SENSITIVE:
+            slug = slug.lower()
+
+        return ("slug", slug)
+
+    def _track_write(self, content_type, obj_id, slug=None):
+        timeout = settings.SLUGGABLE_READ_YOUR_WRITES_TIMEOUT
+
+        if not timeout:
+            return
+
+        now = time.monotonic()
+
+        if len(_recent_writes) > 10000:
+            for key, deadline in list(_recent_writes.items()):
+                if deadline <= now:
+                    _recent_writes.pop(key, None)
+
+        _recent_writes[self._get_write_key(content_type, obj_id)] = now + timeout
+
+        if slug is not None:
+            _recent_writes[self._get_slug_write_key(slug)] = now + timeout
+
+    def get_partitions(self):
+        """
+        Returns every decider model sharing the slug namespace of this one.
+        """
+        results = [self.model]
+
+        for partition in (self.model.partitions or {}).values():
+            if isinstance(partition, str):
+                partition = apps.get_model(partition)
+
+            if partition not in results:
+                results.append(partition)
+
+        return results
+
+    def get_registry(self):
+        """
+        Returns the model registering every slug of the decider and its
+        partitions, or ``None``.
+        """
+        registry = self.model.registry
+
+        if isinstance(registry, str):
+            registry = apps.get_model(registry)
+
+        return registry
+
+    def _get_unique_models(self):
+        # models queried to check a slug is not used by another object
+        registry = self.get_registry()
+
+        if registry is not None:
+            return [registry]
+
+        return self.get_partitions()
+
+    def _get_manager(self, partition):
+        return partition.objects.db_manager(self._db)
+
+    def filter_by_obj(self, obj, **kwargs):
+        content_type = kwargs.get("content_type")
+
+        partition = self.get_partition(obj, content_type)
+
+        if partition is not self.model:
+            return self._get_manager(partition).filter_by_obj(obj, **kwargs)
+
+        if content_type is None:
+            content_type = ContentType.objects.get_for_model(obj)
+
+        return (
+            self.get_queryset()
+            .using(self.get_read_db(content_type, obj.pk))
+            .filter_by_obj(obj, **kwargs)
+        )
+
+    def filter_by_obj_id(self, obj_id, content_type, **kwargs):
+        partition = self.get_partition(content_type=content_type)
+
+        if partition is not self.model:
+            return self._get_manager(partition).filter_by_obj_id(
+                obj_id, content_type, **kwargs
+            )
+
+        return (
+            self.get_queryset()
+            .using(self.get_read_db(content_type, obj_id))
+            .filter_by_obj_id(obj_id, content_type, **kwargs)
+        )
+
+    def filter_by_model(self, klass, **kwargs):
+        partition = self.get_partition(klass, kwargs.get("content_type"))
+
+        if partition is not self.model:
+            return self._get_manager(partition).filter_by_model(klass, **kwargs)
+
+        return (
+            self.get_queryset()
+            .using(self.get_read_db())
+            .filter_by_model(klass, **kwargs)
+        )
+
+    def filter_by_slug(self, slug, *args, **kwargs):
+        return (
+            self.get_queryset()
+            .using(self.get_read_db(slug=slug))
+            .filter_by_slug(slug, *args, **kwargs)
+        )
+
+    def filter_by_slugs(self, *args, **kwargs):
+        return (
+            self.get_queryset()
+            .using(self.get_read_db())
+            .filter_by_slugs(*args, **kwargs)
+        )
+
+    def prefix(self, value, after=None, limit=None):
+        """
+        Returns slugs of the decider and its partitions starting with
+        ``value``, a list merging the results of each partition when the
+        decider has partitions.
+        """
+        db = self.get_read_db()
+
+        partitions = self.get_partitions()
+
+        if len(partitions) == 1:
+            return self.get_queryset().using(db).prefix(value, after, limit)
+
+        def get_key(instance):
+            if settings.SLUGGABLE_CASE_SENSITIVE:
+                return instance.slug
+
+            return instance.slug.lower(), instance.slug
+
+        results = heapq.merge(
+            *[
+                partition.objects.get_queryset().using(db).prefix(value, after, limit)
+                for partition in partitions
+            ],
+            key=get_key
+        )
+
+        return list(itertools.islice(results, limit))
 
     def get_current(self, obj, content_type=None):
         if isinstance(obj, models.Model):
@@ -68,75 +406,688 @@ class SlugManager(models.Manager):
         else:
             obj_id = obj
 
-        try:
-            return self.filter_by_obj_id(
-                obj_id, content_type=content_type, redirect=False
-            ).get()
-        except ObjectDoesNotExist:
+        partition = self.get_partition(content_type=content_type)
+
+        if partition is not self.model:
+            return self._get_manager(partition).get_current(
+                obj_id, content_type=content_type
+            )
+
+        def get_current():
+            try:
+                return self.filter_by_obj_id(
+                    obj_id, content_type=content_type, redirect=False
+                ).get()
+            except ObjectDoesNotExist:
+                return None
+
+        return cache.get_or_set(
+            self._get_current_cache_key(content_type, obj_id), get_current
+        )
+
+    def _get_current_cache_key(self, content_type, obj_id):
+        return "sluggable:current:%s:%s:%s" % (
+            self.model._meta.label_lower,
+            get_obj_id(content_type),
+            obj_id,
+        )
+
+    def _get_resolve_cache_key(self, slug):
+        return "sluggable:resolve:%s:%s" % (
+            self.model._meta.label_lower,
+            get_slug_hash(slug),
+        )
+
+    def _cache_slugs(self, content_type, object_ids, db):
+        """
+        Writes the current slugs of objects to the resolution cache so
+        readers of their previous slugs do not all miss after a rename.
+
+        The cache is written once the transaction is committed, readers never
+        see slugs which could be rolled back.
+        """
+        if not self.cache_writes or cache.get_cache() is None:
+            return
+
+        partition = self.get_partition(content_type=content_type)
+
+        def write():
+            rows = list(
+                partition.objects.get_queryset()
+                .using(db)
+                .filter(content_type=content_type, object_id__in=object_ids)
+            )
+
+            current = dict((row.object_id, row) for row in rows if not row.redirect)
+
+            values = dict(
+                (self._get_resolve_cache_key(row.slug), current.get(row.object_id))
+                for row in rows
+            )
+
+            for object_id in object_ids:
+                key = partition.objects._get_current_cache_key(content_type, object_id)
+
+                values[key] = current.get(object_id)
+
+            cache.set_many(values)
+
+        transaction.on_commit(write, using=db)
+
+    def resolve(self, slug):
+        """
+        Returns the current slug of the object owning ``slug``.
+        """
+        return cache.get_or_set(
+            self._get_resolve_cache_key(slug), lambda: self._resolve(slug)
+        )
+
+    def _resolve(self, slug):
+        db = self.get_read_db(slug=slug)
+
+        querysets = [
+            partition.objects.get_queryset().using(db)
+            for partition in self.get_partitions()
+        ]
+
+        lookups = [{}]
+
+        if not settings.SLUGGABLE_CASE_SENSITIVE:
+            # slugs only differing by case can coexist, the exact one wins
+            # then the first one in a deterministic order
+            lookups.append({"iexact": True})
+
+        for kwargs in lookups:
+            for qs in querysets:
+                instance = (
+                    qs.filter_by_slug(slug, **kwargs).order_by("slug", "pk").first()
+                )
+
+                if instance is not None:
+                    return instance.current
+
+        return None
+
+    def _get_reservation_key(self, slug):
+        if not settings.SLUGGABLE_CASE_SENSITIVE:
+            slug = slug.lower()
+
+        return "sluggable:%s:%s" % (self.model._meta.label_lower, slug)
+
+    def reserve(self, slug, ttl=60):
+        """
+        Reserves ``slug`` for ``ttl`` seconds if it is available, returns
+        the reservation token or ``None``.
+        """
+        if not self.is_slug_available(slug, for_write=True):
             return None
 
-    def is_slug_available(self, slug, obj=None):
+        return get_reservation_store().reserve(self._get_reservation_key(slug), ttl)
+
+    def release(self, slug, token):
+        """
+        Releases the reservation of ``slug`` held by ``token``.
+        """
+        return get_reservation_store().release(self._get_reservation_key(slug), token)
+
+    def is_slug_reserved(self, slug, token=None):
+        """
+        Returns ``True`` if ``slug`` has a live reservation not held by
+        ``token``.
+        """
+        reservation = get_reservation_store().get(self._get_reservation_key(slug))
+
+        return reservation is not None and reservation != token
+
+    def get_canonical_slug(self, slug):
+        """
+        Returns the current slug of the object owning ``slug`` with a single
+        query joining the decider on itself, or the resolution cache.
+        """
+        if cache.get_cache() is not None:
+            current = self.resolve(slug)
+
+            return current.slug if current is not None else None
+
+        db = self.get_read_db(slug=slug)
+
+        for partition in self.get_partitions():
+            qs = partition.objects.get_queryset().using(db)
+
+            current = qs.filter(
+                content_type=OuterRef("content_type"),
+                object_id=OuterRef("object_id"),
+                redirect=False,
+            ).values("slug")[:1]
+
+            results = list(
+                qs.filter_by_slug(slug, iexact=not settings.SLUGGABLE_CASE_SENSITIVE)
+                .annotate(canonical=Subquery(current))
+                .values_list("canonical", flat=True)[:1]
+            )
+
+            if results:
+                return results[0]
+
+        return None
+
+    def is_slug_available(self, slug, obj=None, for_write=False, token=None):
+        """
+        Returns ``True`` if ``slug`` is not used nor reserved (unless by
+        ``token``), pass ``for_write`` when the result is used to save an
+        object to query the write database.
+        """
         if slug in self.model.forbidden_slugs():
             return False
 
-        if settings.SLUGGABLE_CASE_SENSITIVE:
-            qs = self.filter(slug=slug)
+        if self.is_slug_reserved(slug, token):
+            return False
+
+        if for_write:
+            db = self.get_write_db()
         else:
-            qs = self.filter(slug__iexact=slug)
+            db = self.get_read_db(slug=slug)
 
-        if obj is not None:
-            qs = qs.filter_by_obj(obj, exclude=True)
+        for partition in self._get_unique_models():
+            qs = (
+                partition.objects.get_queryset()
+                .using(db)
+                .filter_by_slug(slug, iexact=not settings.SLUGGABLE_CASE_SENSITIVE)
+            )
 
-        if qs.exists():
-            return False
+            if obj is not None:
+                qs = qs.filter_by_obj(obj, exclude=True)
+
+            if qs.exists():
+                return False
 
         return True
 
+    def delete_by_obj(self, obj):
+        """
+        Deletes the slugs of ``obj`` from the write database and the cache.
+        """
+        qs = self.for_write().filter_by_obj(obj)
+
+        keys = []
+
+        if cache.get_cache() is not None:
+            content_type = ContentType.objects.get_for_model(obj)
+
+            partition = self.get_partition(content_type=content_type)
+
+            keys = [
+                self._get_resolve_cache_key(slug)
+                for slug in qs.values_list("slug", flat=True)
+            ]
+            keys.append(partition.objects._get_current_cache_key(content_type, obj.pk))
+
+        qs.delete()
+
+        registry = self.get_registry()
+
+        if registry is not None:
+            registry.objects.using(self.get_write_db()).filter_by_obj(obj).delete()
+
+        if keys:
+            # readers may cache the deleted slugs until the deletion is committed
+            transaction.on_commit(
+                lambda: cache.delete_many(keys), using=self.get_write_db()
+            )
+
+    def get_used_slugs(self, slugs, obj=None):
+        """
+        Returns which of ``slugs`` are used by objects other than ``obj`` or
+        reserved by others than ``obj.slug_reservation_token``.
+        """
+        token = get_reservation_token(obj)
+
+        used = set(slug for slug in slugs if self.is_slug_reserved(slug, token))
+
+        db = self.get_write_db()
+
+        for partition in self._get_unique_models():
+            qs = (
+                partition.objects.get_queryset().using(db).filter_by_unique_slugs(slugs)
+            )
+
+            if obj is not None:
+                qs = qs.filter_by_obj(obj, exclude=True)
+
+            if has_slug_hash(partition):
+                hashes = set(qs.values_list("slug_hash", flat=True))
+
+                used.update(slug for slug in slugs if get_slug_hash(slug) in hashes)
+            else:
+                used.update(qs.values_list("slug", flat=True))
+
+        return used
+
     def generate_unique_slug(self, instance, slug, max_length, index_sep):
+        content_type = ContentType.objects.get_for_model(instance)
+
+        token = get_reservation_token(instance)
+
+        def filter_by_slug(qs, slug):
+            return qs.filter_by_unique_slug(slug)
+
+        def is_reserved(slug):
+            return self.is_slug_reserved(slug, token)
+
+        db = self.get_write_db()
+
+        qs = [
+            partition.objects.get_queryset()
+            .using(db)
+            .filter_by_obj(instance, content_type=content_type, exclude=True)
+            for partition in self._get_unique_models()
+        ]
+
+        return generate_unique_slug(
+            qs,
+            instance,
+            slug,
+            max_length,
+            "slug",
+            index_sep,
+            filter_func=filter_by_slug,
+            is_reserved=is_reserved,
+        )
+
+    def _register_slugs(self, content_type, slugs, db):
+        """
+        Registers ``slugs``, a mapping of slugs to the id of their object,
+        the unique constraint of the registry rejects slugs owned by other
+        objects, even when they are saved concurrently in another partition.
+        """
+        qs = self.get_registry().objects.using(db)
+
+        registered = set()
+
+        for slug, content_type_id, object_id in qs.filter(
+            slug__in=slugs.keys()
+        ).values_list("slug", "content_type_id", "object_id"):
+            if content_type_id != content_type.pk or slugs[slug] != object_id:
+                raise IntegrityError("Slug %s is not available" % slug)
+
+            registered.add(slug)
 
-        qs = self.filter_by_obj(instance, exclude=True)
+        qs.bulk_create(
+            [
+                qs.model(content_type=content_type, object_id=object_id, slug=slug)
+                for slug, object_id in slugs.items()
+                if slug not in registered
+            ]
+        )
+
+    def rebuild_registry(self, batch_size=2000):
+        """
+        Fills the registry from the decider and its partitions, e.g. after
+        adding a registry to an existing decider.
+        """
+        registry = self.get_registry()
+
+        db = self.get_write_db()
+
+        qs = registry.objects.using(db)
+
+        with transaction.atomic(using=db):
+            qs.all().delete()
 
-        return generate_unique_slug(qs, instance, slug, max_length, "slug", index_sep)
+            for partition in self.get_partitions():
+                rows = (
+                    partition.objects.get_queryset()
+                    .using(db)
+                    .values_list("content_type_id", "object_id", "slug")
+                    .iterator(chunk_size=batch_size)
+                )
 
-    def update_slug(self, instance, slug, erase_redirects=False, created=False):
+                qs.bulk_create(
+                    (
+                        registry(
+                            content_type_id=content_type_id,
+                            object_id=object_id,
+                            slug=slug,
+                        )
+                        for content_type_id, object_id, slug in rows
+                    ),
+                    batch_size=batch_size,
+                )
+
+    def update_slug(
+        self, instance, slug, erase_redirects=False, created=False, aliases=()
+    ):
+        """
+        Makes ``slug`` the current slug of ``instance``, ``aliases`` are
+        other slugs of ``instance`` stored as redirections to it.
+        """
         content_type = ContentType.objects.get_for_model(instance)
 
-        pk = instance.pk
+        partition = self.get_partition(content_type=content_type)
 
-        update = False
-        affected = True
-        filters = {
-            "content_type": content_type,
-            "object_id": pk,
-            "redirect": False,
-            "slug": slug,
-        }
+        aliases = [alias for alias in aliases if alias != slug]
+
+        with self._register(
+            content_type, instance.pk, [slug] + aliases, erase_redirects
+        ):
+            if partition is not self.model:
+                manager = self._get_manager(partition)
+
+                # cached below with the keys of this decider
+                manager.cache_writes = False
+
+                manager.update_slug(
+                    instance,
+                    slug,
+                    erase_redirects=erase_redirects,
+                    created=created,
+                    aliases=aliases,
+                )
+
+                self._cache_slugs(content_type, [instance.pk], self.get_write_db())
+
+                return
+
+            db = self.get_write_db()
+
+            pk = instance.pk
+
+            update = False
+            affected = True
+            filters = {
+                "content_type": content_type,
+                "object_id": pk,
+                "redirect": False,
+                "slug": slug,
+            }
 
-        if not created:
-            try:
-                current = self.get(**filters)
-                new = False
-                update = current.slug != slug
-            except self.model.DoesNotExist:
-                new = True
-                update = True
-
-        if created or update:
             if not created:
-                base_qs = self.filter(content_type=content_type, object_id=pk)
+                try:
+                    current = self.get_queryset().using(db).get(**filters)
+                    new = False
+                    update = current.slug != slug
+                except self.model.DoesNotExist:
+                    new = True
+                    update = True
+
+            if created or update:
+                if not created:
+                    base_qs = (
+                        self.get_queryset()
+                        .using(db)
+                        .filter(content_type=content_type, object_id=pk)
+                    )
+
+                    qs = base_qs.exclude(slug=slug)
+
+                    if not new and erase_redirects:
+                        qs.delete()
+                    else:
+                        qs.update(redirect=True)
+
+                    affected = base_qs.filter(slug=slug).update(redirect=False)
+
+                if not affected or created:
+                    self.model(**filters).save(using=db)
+
+            if aliases:
+                self._add_aliases(content_type, pk, aliases, db)
+
+            if created or update or aliases:
+                self._track_write(content_type, pk, slug)
+
+                self._cache_slugs(content_type, [pk], db)
+
+    def _add_aliases(self, content_type, obj_id, aliases, db):
+        qs = (
+            self.get_queryset()
+            .using(db)
+            .filter(content_type=content_type, object_id=obj_id)
+        )
+
+        existing = set(qs.filter(slug__in=aliases).values_list("slug", flat=True))
+
+        qs.bulk_create(
+            [
+                self.model(
+                    content_type=content_type,
+                    object_id=obj_id,
+                    slug=alias,
+                    redirect=True,
+                )
+                for alias in aliases
+                if alias not in existing
+            ]
+        )
+
+    @contextmanager
+    def _register(self, content_type, obj_id, slugs, erase_redirects=False):
+        """
+        Registers ``slugs`` in the registry of the decider, if any, in the
+        transaction updating the slugs of the object.
+        """
+        registry = self.get_registry()
+
+        if registry is None:
+            yield
+            return
+
+        db = self.get_write_db()
+
+        with transaction.atomic(using=db):
+            self._register_slugs(
+                content_type, dict((slug, obj_id) for slug in slugs), db
+            )
+
+            yield
+
+            if erase_redirects:
+                partition = self.get_partition(content_type=content_type)
+
+                registry.objects.using(db).filter(
+                    content_type=content_type, object_id=obj_id
+                ).exclude(
+                    slug__in=partition.objects.get_queryset()
+                    .using(db)
+                    .filter(content_type=content_type, object_id=obj_id)
+                    .values("slug")
+                ).delete()
 
-                qs = base_qs.exclude(slug=slug)
+    def get_sluggable_field(self, model, field_name=None):
+        """
+        Returns the field of ``model`` storing its slug in this decider.
+        """
+        for field in model._meta.fields:
+            decider = getattr(field, "decider", None)
 
-                if not new and erase_redirects:
-                    qs.delete()
-                else:
-                    qs.update(redirect=True)
+            if decider is None or (field_name and field.name != field_name):
+                continue
 
-                affected = base_qs.filter(slug=slug).update(redirect=False)
+            if decider is self.model or self.model in decider.objects.get_partitions():
+                return field
 
-            if not affected or created:
-                slug = self.model(**filters)
-                slug.save()
+        raise ValueError(
+            "%s has no sluggable field using %s" % (model.__name__, self.model.__name__)
+        )
+
+    def bulk_rename(self, objects, transform=None, field_name=None, chunk_size=1000):
+        """
+        Renames objects with set-based queries, one transaction per chunk.
+
+        ``objects`` is a mapping of instances to their new slug, or an
+        iterable of instances (e.g. a queryset) when ``transform`` is given
+        to compute the new slug of each instance.
+
+        Returns the number of renamed instances.
+        """
+        if transform is None:
+            items = objects.items()
+        else:
+            if isinstance(objects, QuerySet):
+                objects = objects.iterator(chunk_size=chunk_size)
+
+            items = ((obj, transform(obj)) for obj in objects)
+
+        count = 0
+        chunk = []
+
+        for item in items:
+            chunk.append(item)
+
+            if len(chunk) >= chunk_size:
+                count += self._bulk_rename(chunk, field_name)
+                chunk = []
+
+        if chunk:
+            count += self._bulk_rename(chunk, field_name)
+
+        return count
+
+    def _bulk_rename(self, items, field_name):
+        db = self.get_write_db()
+
+        groups = {}
+
+        for obj, slug in items:
+            groups.setdefault(obj.__class__, []).append((obj, slug))
+
+        count = 0
+
+        with transaction.atomic(using=db):
+            for model, items in groups.items():
+                count += self._bulk_rename_model(model, items, field_name, db)
+
+        return count
+
+    def _bulk_rename_model(self, model, items, field_name, db):
+        field = self.get_sluggable_field(model, field_name)
+
+        for decider, fields in model._sluggable_coordinator.get_fields_by_decider():
+            if decider is field.decider and fields[0] is not field:
+                raise ValueError(
+                    "%s.%s shares its decider with a previous field, only the "
+                    "first one can be renamed in bulk" % (model.__name__, field.name)
+                )
+
+        content_type = ContentType.objects.get_for_model(model)
+
+        if settings.SLUGGABLE_CASE_SENSITIVE:
+            normalize = str
+        else:
+            normalize = str.lower
+
+        forbidden = set(normalize(slug) for slug in self.model.forbidden_slugs())
+
+        renames = {}
+
+        for obj, slug in items:
+            slug = crop_slug(slug, field.max_length)
+
+            if slug == getattr(obj, field.attname):
+                continue
+
+            key = normalize(slug)
+
+            if (
+                key in renames
+                or key in forbidden
+                or self.is_slug_reserved(slug, get_reservation_token(obj))
+            ):
+                raise IntegrityError("Slug %s is not available" % slug)
+
+            renames[key] = (obj, slug)
+
+        if not renames:
+            return 0
+
+        reclaimed = []
+
+        for partition in self._get_unique_models():
+            qs = (
+                partition.objects.get_queryset()
+                .using(db)
+                .filter_by_slugs(
+                    renames.keys(), iexact=not settings.SLUGGABLE_CASE_SENSITIVE
+                )
+            )
+
+            for slug, content_type_id, object_id in qs.values_list(
+                "slug", "content_type_id", "object_id"
+            ):
+                obj = renames[normalize(slug)][0]
+
+                if content_type_id != content_type.pk or object_id != obj.pk:
+                    raise IntegrityError("Slug %s is not available" % slug)
+
+                reclaimed.append(slug)
+
+        if self.get_registry() is not None:
+            self._register_slugs(
+                content_type,
+                dict((slug, obj.pk) for obj, slug in renames.values()),
+                db,
+            )
+
+        partition = self.get_partition(content_type=content_type)
+
+        qs = partition.objects.get_queryset().using(db)
+
+        qs.filter(
+            content_type=content_type,
+            object_id__in=[obj.pk for obj, slug in renames.values()],
+            redirect=False,
+        ).update(redirect=True)
+
+        if reclaimed:
+            qs.filter(content_type=content_type, slug__in=reclaimed).update(
+                redirect=False
+            )
+
+        reclaimed = set(normalize(slug) for slug in reclaimed)
+
+        qs.bulk_create(
+            [
+                partition(content_type=content_type, object_id=obj.pk, slug=slug)
+                for key, (obj, slug) in renames.items()
+                if key not in reclaimed
+            ]
+        )
+
+        instances = []
+
+        for obj, slug in renames.values():
+            setattr(obj, field.name, slug)
+            setattr(obj, "%s_changed" % field.name, False)
+
+            instances.append(obj)
+
+            partition.objects._track_write(content_type, obj.pk, slug)
+
+        model._default_manager.bulk_update(instances, [field.name])
+
+        self._cache_slugs(content_type, [obj.pk for obj in instances], db)
+
+        return len(instances)
+
+
+class SlugRegistry(models.Model):
+    """
+    Stores every slug of a decider and its partitions in a single table so
+    the database enforces their uniqueness.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.PROTECT)
+    object_id = models.PositiveIntegerField()
+
+    slug = models.CharField(max_length=255, unique=True)
+
+    objects = SlugQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return self.slug
 
 
 class Slug(models.Model):
@@ -153,8 +1104,22 @@ class Slug(models.Model):
 
     objects = SlugManager()
 
+    # maps "app_label.model" of sluggable models to the concrete decider
+    # (model or "app_label.ModelName") storing their slugs
+    partitions = None
+
+    # model (or "app_label.ModelName") subclassing SlugRegistry, used to
+    # enforce uniqueness across partitions
+    registry = None
+
     class Meta:
         abstract = True
+        # only used by deciders whose Meta inherits from Slug.Meta
+        indexes = [
+            SlugPrefixIndex(),
+            # lookups of the current slug of an object
+            models.Index(fields=["content_type", "object_id", "redirect"]),
+        ]
 
     def __str__(self):
         return _("%s for %s") % (self.slug, self.content_object)
@@ -173,3 +1138,13 @@ class Slug(models.Model):
         return klass.objects.get_current(
             self.object_id, content_type=self.content_type_id
         )
+
+
+class HashedSlug(Slug):
+    # slugs are unique through their digest, the wide slug column is not indexed
+    slug = models.CharField(max_length=255, verbose_name=_("URL"))
+    slug_hash = SlugHashField(unique=True)
+
+    class Meta:
+        abstract = True
+        indexes = [models.Index(fields=["content_type", "object_id", "redirect"])]
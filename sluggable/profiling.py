@@ -0,0 +1,142 @@
+import os
+import sys
+import time
+
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+package_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+# clients of the library, their own queries are not attributed to sluggable
+excluded_dirs = tuple(
+    os.path.join(package_dir, name, "") for name in ("management", "tests")
+)
+
+
+def get_call_site():
+    """
+    Returns the name of the innermost sluggable function in the call stack.
+    """
+    frame = sys._getframe(1)
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        name = frame.f_code.co_name
+
+        if (
+            filename.startswith(package_dir)
+            and filename != __file__
+            and not filename.startswith(excluded_dirs)
+            and not name.startswith("<")
+        ):
+            return name
+
+        frame = frame.f_back
+
+    return None
+
+
+class QueryProfile(object):
+    """
+    Records queries with the sluggable function which issued them, to be
+    used as an execute wrapper.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "sql": sql,
+                    "alias": context["connection"].alias,
+                    "duration": time.perf_counter() - start,
+                    "call_site": get_call_site(),
+                }
+            )
+
+    def get_queries(self, call_site=None):
+        """
+        Returns queries issued by sluggable, or by ``call_site`` only.
+        """
+        return [
+            query
+            for query in self.queries
+            if query["call_site"]
+            and (call_site is None or query["call_site"] == call_site)
+        ]
+
+    def summary(self):
+        """
+        Returns the number of queries and their duration by call site, queries
+        not issued by sluggable are grouped under ``None``.
+        """
+        results = {}
+
+        for query in self.queries:
+            stats = results.setdefault(query["call_site"], {"count": 0, "duration": 0})
+            stats["count"] += 1
+            stats["duration"] += query["duration"]
+
+        return results
+
+    def report(self):
+        lines = []
+
+        summary = sorted(
+            self.summary().items(), key=lambda item: item[1]["duration"], reverse=True
+        )
+
+        for call_site, stats in summary:
+            lines.append(
+                "%-30s %5d queries %10.2f ms"
+                % (call_site or "(other)", stats["count"], stats["duration"] * 1000)
+            )
+
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_slug_queries(using=None):
+    """
+    Records queries executed on ``using`` (all databases by default)::
+
+        with profile_slug_queries() as profile:
+            user.save()
+
+        print(profile.report())
+    """
+    profile = QueryProfile()
+
+    if using is None:
+        aliases = list(connections)
+    else:
+        aliases = [using]
+
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(profile))
+
+        yield profile
+
+
+class SlugQueriesTestMixin(object):
+    @contextmanager
+    def assertMaxSlugQueries(self, num, call_site=None, using=None):
+        with profile_slug_queries(using) as profile:
+            yield profile
+
+        executed = len(profile.get_queries(call_site))
+
+        if executed > num:
+            self.fail(
+                "%d sluggable queries executed, at most %d expected\n%s"
+                % (executed, num, profile.report())
+            )
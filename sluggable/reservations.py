@@ -0,0 +1,146 @@
+import abc
+import threading
+import time
+import uuid
+
+from contextlib import contextmanager
+from functools import lru_cache
+
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from . import settings
+
+
+class BaseReservationStore(abc.ABC):
+    @abc.abstractmethod
+    def reserve(self, key, ttl):
+        """
+        Reserves ``key`` for ``ttl`` seconds, returns a token or ``None``
+        if ``key`` is already reserved.
+        """
+
+    @abc.abstractmethod
+    def release(self, key, token):
+        """
+        Releases the reservation of ``key`` if it is held by ``token``.
+        """
+
+    @abc.abstractmethod
+    def get(self, key):
+        """
+        Returns the token of the live reservation of ``key`` if any.
+        """
+
+
+class LocalReservationStore(BaseReservationStore):
+    """
+    Keeps reservations in memory, only suitable for a single process.
+    """
+
+    def __init__(self):
+        self._reservations = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key, ttl):
+        now = time.monotonic()
+
+        with self._lock:
+            reservation = self._reservations.get(key)
+
+            if reservation is not None and reservation[1] > now:
+                return None
+
+            token = uuid.uuid4().hex
+
+            self._reservations[key] = (token, now + ttl)
+
+        return token
+
+    def release(self, key, token):
+        with self._lock:
+            reservation = self._reservations.get(key)
+
+            if reservation is None or reservation[0] != token:
+                return False
+
+            del self._reservations[key]
+
+        return True
+
+    def get(self, key):
+        reservation = self._reservations.get(key)
+
+        if reservation is None:
+            return None
+
+        if reservation[1] <= time.monotonic():
+            with self._lock:
+                if self._reservations.get(key) is reservation:
+                    del self._reservations[key]
+
+            return None
+
+        return reservation[0]
+
+
+class CacheReservationStore(BaseReservationStore):
+    """
+    Keeps reservations in the Django cache defined by
+    ``SLUGGABLE_RESERVATION_CACHE``, shared between processes.
+    """
+
+    # seconds a reserve or release can hold the lock of a key
+    lock_timeout = 5
+
+    def __init__(self):
+        self.cache = caches[settings.SLUGGABLE_RESERVATION_CACHE]
+
+    @contextmanager
+    def lock(self, key, attempts=50, delay=0.01):
+        """
+        Serializes reservations and releases of ``key`` so a release can
+        compare and delete its token atomically, yields ``False`` if the
+        lock could not be acquired.
+        """
+        lock_key = "%s:lock" % key
+
+        for _ in range(attempts):
+            if self.cache.add(lock_key, 1, self.lock_timeout):
+                break
+
+            time.sleep(delay)
+        else:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            self.cache.delete(lock_key)
+
+    def reserve(self, key, ttl):
+        token = uuid.uuid4().hex
+
+        with self.lock(key) as locked:
+            if locked and self.cache.add(key, token, ttl):
+                return token
+
+        return None
+
+    def release(self, key, token):
+        with self.lock(key) as locked:
+            if not locked or token is None or self.cache.get(key) != token:
+                return False
+
+            self.cache.delete(key)
+
+        return True
+
+    def get(self, key):
+        return self.cache.get(key)
+
+
+@lru_cache(maxsize=None)
+def get_reservation_store():
+    return import_string(settings.SLUGGABLE_RESERVATION_STORE)()
@@ -1,32 +1,84 @@
+from functools import lru_cache
+
 from django.conf import settings
 
-# use custom slugifying function if any
-slugify = getattr(settings, "SLUGGABLE_SLUGIFY_FUNCTION", None)
 
-if not slugify:
-    try:
-        # i18n-friendly approach
-        from unidecode import unidecode
+@lru_cache(maxsize=None)
+def get_slugify_function():
+    """
+    Resolves the slugifying function on first use.
+    """
+    # use custom slugifying function if any
+    func = getattr(settings, "SLUGGABLE_SLUGIFY_FUNCTION", None)
+
+    if not func:
+        try:
+            # i18n-friendly approach
+            from unidecode import unidecode
+
+            func = lambda s: unidecode(s).replace(" ", "-")
+        except ImportError:
+            try:
+                # Cyrillic transliteration (primarily Russian)
+                from pytils.translit import slugify as func
+            except ImportError:
+                # fall back to Django's default method
+                func = "django.template.defaultfilters.slugify"
 
-        slugify = lambda s: unidecode(s).replace(" ", "-")
-    except ImportError:
+    # find callable by string
+    if isinstance(func, str):
         try:
-            # Cyrillic transliteration (primarily Russian)
-            from pytils.translit import slugify
+            from django.core.urlresolvers import get_callable
         except ImportError:
-            # fall back to Django's default method
-            slugify = "django.template.defaultfilters.slugify"
+            from django.urls.resolvers import get_callable
 
-# find callable by string
-if isinstance(slugify, str):
-    try:
-        from django.core.urlresolvers import get_callable
-    except ImportError:
-        from django.urls.resolvers import get_callable
+        func = get_callable(func)
 
-    slugify = get_callable(slugify)
+    return func
+
+
+def slugify(value):
+    return get_slugify_function()(value)
 
 
 SLUGGABLE_SEPARATOR = getattr(settings, "SLUGGABLE_SEPARATOR", "-")
 
 SLUGGABLE_CASE_SENSITIVE = getattr(settings, "SLUGGABLE_CASE_SENSITIVE", False)
+
+# database aliases used by SlugManager, fall back to the database routers
+SLUGGABLE_READ_DATABASE = getattr(settings, "SLUGGABLE_READ_DATABASE", None)
+
+SLUGGABLE_WRITE_DATABASE = getattr(settings, "SLUGGABLE_WRITE_DATABASE", None)
+
+# seconds during which reads for a renamed object are sent to the write database
+SLUGGABLE_READ_YOUR_WRITES_TIMEOUT = getattr(
+    settings, "SLUGGABLE_READ_YOUR_WRITES_TIMEOUT", 0
+)
+
+SLUGGABLE_RESERVATION_STORE = getattr(
+    settings,
+    "SLUGGABLE_RESERVATION_STORE",
+    "sluggable.reservations.LocalReservationStore",
+)
+
+SLUGGABLE_RESERVATION_CACHE = getattr(
+    settings, "SLUGGABLE_RESERVATION_CACHE", "default"
+)
+
+# cache alias used for slug resolution, disabled by default
+SLUGGABLE_RESOLVE_CACHE = getattr(settings, "SLUGGABLE_RESOLVE_CACHE", None)
+
+SLUGGABLE_RESOLVE_CACHE_TIMEOUT = getattr(
+    settings, "SLUGGABLE_RESOLVE_CACHE_TIMEOUT", 60
+)
+
+# seconds during which expired values are served while being refreshed
+SLUGGABLE_RESOLVE_CACHE_STALE_TIMEOUT = getattr(
+    settings, "SLUGGABLE_RESOLVE_CACHE_STALE_TIMEOUT", 300
+)
+
+# coalesce concurrent resolutions of the same slug in a process
+SLUGGABLE_SINGLE_FLIGHT = getattr(settings, "SLUGGABLE_SINGLE_FLIGHT", False)
+
+# maps URL names to (decider, URL keyword argument) for SlugRedirectMiddleware
+SLUGGABLE_REDIRECT_URLS = getattr(settings, "SLUGGABLE_REDIRECT_URLS", {})
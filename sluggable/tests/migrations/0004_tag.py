@@ -0,0 +1,72 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+import sluggable.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tests", "0003_book"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200)),
+                ("slug", sluggable.fields.SluggableField(max_length=255)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TagSlug",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField()),
+                (
+                    "slug",
+                    models.CharField(
+                        db_index=True, max_length=255, unique=True, verbose_name="URL"
+                    ),
+                ),
+                (
+                    "redirect",
+                    models.BooleanField(default=False, verbose_name="Redirection"),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                (
+                    "slug_hash",
+                    sluggable.fields.SlugHashField(db_index=True, editable=False),
+                ),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:29
+
+from django.db import migrations
+import django.db.models.functions.text
+import sluggable.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tests", "0005_registry"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="answerslug",
+            index=sluggable.indexes.SlugPrefixIndex(
+                django.db.models.functions.text.Lower("slug"),
+                name="tests_answerslug_0b0acc_pfx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="articleslug",
+            index=sluggable.indexes.SlugPrefixIndex(
+                django.db.models.functions.text.Lower("slug"),
+                name="tests_articleslug_e6cea9_pfx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookslug",
+            index=sluggable.indexes.SlugPrefixIndex(
+                django.db.models.functions.text.Lower("slug"),
+                name="tests_bookslug_284076_pfx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentslug",
+            index=sluggable.indexes.SlugPrefixIndex(
+                django.db.models.functions.text.Lower("slug"),
+                name="tests_contentslug_514a57_pfx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pollslug",
+            index=sluggable.indexes.SlugPrefixIndex(
+                django.db.models.functions.text.Lower("slug"),
+                name="tests_pollslug_ec196b_pfx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userslug",
+            index=sluggable.indexes.SlugPrefixIndex(
+                django.db.models.functions.text.Lower("slug"),
+                name="tests_userslug_b20e34_pfx",
+            ),
+        ),
+    ]
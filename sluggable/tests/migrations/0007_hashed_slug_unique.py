@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:33
+
+from django.db import migrations, models
+import sluggable.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tests", "0006_prefix_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="tagslug",
+            name="slug",
+            field=models.CharField(max_length=255, verbose_name="URL"),
+        ),
+        migrations.AlterField(
+            model_name="tagslug",
+            name="slug_hash",
+            field=sluggable.fields.SlugHashField(editable=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tests", "0007_hashed_slug_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="answerslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_answe_content_6d8c87_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="articleslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_artic_content_116e6c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_books_content_d26a25_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_conte_content_78b3b0_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pollslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_polls_content_b38bfb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tagslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_tagsl_content_3f639b_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userslug",
+            index=models.Index(
+                fields=["content_type", "object_id", "redirect"],
+                name="tests_users_content_d87c95_idx",
+            ),
+        ),
+    ]
@@ -1,11 +1,11 @@
 from django.db import models
 
-from sluggable.models import Slug
+from sluggable.models import HashedSlug, Slug, SlugRegistry
 from sluggable.fields import SluggableField
 
 
 class PollSlug(Slug):
-    class Meta:
+    class Meta(Slug.Meta):
         abstract = False
 
 
@@ -19,7 +19,7 @@ class Poll(models.Model):
 
 
 class UserSlug(Slug):
-    class Meta:
+    class Meta(Slug.Meta):
         abstract = False
 
 
@@ -28,9 +28,59 @@ class User(models.Model):
 
 
 class AnswerSlug(Slug):
-    class Meta:
+    class Meta(Slug.Meta):
         abstract = False
 
 
 class Answer(models.Model):
     slug = SluggableField(null=True, decider=AnswerSlug)
+
+
+class ArticleSlug(Slug):
+    class Meta(Slug.Meta):
+        abstract = False
+
+
+class ContentSlugRegistry(SlugRegistry):
+    class Meta:
+        abstract = False
+
+
+class ContentSlug(Slug):
+    partitions = {"tests.article": "tests.ArticleSlug"}
+    registry = "tests.ContentSlugRegistry"
+
+    class Meta(Slug.Meta):
+        abstract = False
+
+
+class Article(models.Model):
+    title = models.CharField(max_length=200)
+    slug = SluggableField(populate_from="title", decider=ContentSlug)
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=200)
+    slug = SluggableField(populate_from="name", decider=ContentSlug)
+
+
+class BookSlug(Slug):
+    class Meta(Slug.Meta):
+        abstract = False
+
+
+class Book(models.Model):
+    title = models.CharField(max_length=200)
+    subtitle = models.CharField(max_length=200)
+    slug = SluggableField(populate_from="title", decider=BookSlug)
+    subtitle_slug = SluggableField(populate_from="subtitle", decider=BookSlug)
+
+
+class TagSlug(HashedSlug):
+    class Meta(HashedSlug.Meta):
+        abstract = False
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=200)
+    slug = SluggableField(populate_from="name", decider=TagSlug, max_length=255)
@@ -0,0 +1,11 @@
+import os
+
+from .settings import *  # noqa
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get("SLUGGABLE_LOADTEST_DATABASE", "loadtest.sqlite3"),
+        "OPTIONS": {"timeout": 30},
+    },
+}
@@ -1,13 +1,62 @@
-from django.test import TestCase
-
-from .models import Answer, AnswerSlug, Poll, PollSlug, UserSlug, User
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from io import StringIO
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import isolate_apps
+
+from sluggable import cache, models, reservations, settings
+from sluggable.models import Slug
+from sluggable.consistency import iter_inconsistencies
+from sluggable.profiling import SlugQueriesTestMixin, profile_slug_queries
+from sluggable.utils import generate_unique_slugs, get_slug_hash
+
+from .models import (
+    Answer,
+    AnswerSlug,
+    Article,
+    ArticleSlug,
+    Book,
+    BookSlug,
+    Category,
+    ContentSlug,
+    ContentSlugRegistry,
+    Poll,
+    PollSlug,
+    Tag,
+    TagSlug,
+    UserSlug,
+    User,
+)
 
 
 class SluggableTests(TestCase):
+    def test_slugify_is_resolved_lazily(self):
+        settings.get_slugify_function.cache_clear()
+
+        self.assertEqual(settings.get_slugify_function.cache_info().currsize, 0)
+
+        self.assertEqual(settings.slugify("Quick test"), "quick-test")
+
+        self.assertEqual(settings.get_slugify_function.cache_info().currsize, 1)
+
     def test_sluggable_models_for_decider(self):
         self.assertEqual(PollSlug.sluggable_models, [Poll])
 
     def test_slug_without_populate_from(self):
+        # the content type lookup is part of the expected queries
+        ContentType.objects.clear_cache()
+
         with self.assertNumQueries(4):
             user = User.objects.create(username="thoas")
 
@@ -167,3 +216,1034 @@ class SluggableTests(TestCase):
         poll.delete()
 
         self.assertEqual(PollSlug.objects.count(), 0)
+
+    def test_slug_row_with_object_pk(self):
+        poll = Poll.objects.create(question="Quick test")
+        poll.slug = "another-test"
+        poll.save()
+
+        other = Poll.objects.create(question="Last test")
+
+        # the row of another-test has the pk of the other poll
+        self.assertEqual(PollSlug.objects.get(slug="another-test").pk, other.pk)
+
+        other.slug = "another-test"
+        other.save()
+
+        self.assertEqual(other.slug, "another-test-2")
+
+
+class PartitionTests(TestCase):
+    def test_get_partition(self):
+        self.assertEqual(ContentSlug.objects.get_partition(Article), ArticleSlug)
+        self.assertEqual(ContentSlug.objects.get_partition(Category), ContentSlug)
+
+    def test_slugs_are_routed_to_partition(self):
+        article = Article.objects.create(title="Quick test")
+        category = Category.objects.create(name="Another test")
+
+        self.assertEqual(ArticleSlug.objects.count(), 1)
+        self.assertEqual(ContentSlug.objects.get_queryset().count(), 1)
+
+        self.assertEqual(ContentSlug.objects.get_current(article).slug, "quick-test")
+        self.assertEqual(ContentSlug.objects.get_current(category).slug, "another-test")
+
+        article.slug = "renamed"
+        article.save()
+
+        self.assertEqual(ContentSlug.objects.filter_by_obj(article).count(), 2)
+        self.assertEqual(
+            ArticleSlug.objects.get(slug="quick-test").current.slug, "renamed"
+        )
+
+        article.delete()
+
+        self.assertEqual(ArticleSlug.objects.count(), 0)
+
+    def test_uniqueness_across_partitions(self):
+        Category.objects.create(name="Quick test")
+
+        article = Article.objects.create(title="Quick test")
+
+        self.assertEqual(article.slug, "quick-test-2")
+
+        self.assertFalse(ContentSlug.objects.is_slug_available("quick-test-2"))
+        self.assertTrue(
+            ContentSlug.objects.is_slug_available("quick-test-2", obj=article)
+        )
+
+    def test_registry(self):
+        article = Article.objects.create(title="Quick test")
+        category = Category.objects.create(name="Another test")
+
+        self.assertEqual(
+            sorted(ContentSlugRegistry.objects.values_list("slug", flat=True)),
+            ["another-test", "quick-test"],
+        )
+
+        article.slug = "renamed"
+        article.save()
+
+        self.assertEqual(ContentSlugRegistry.objects.filter_by_obj(article).count(), 2)
+
+        # a slug registered concurrently by another partition is rejected
+        with self.assertRaises(IntegrityError):
+            ContentSlug.objects.update_slug(category, "renamed")
+
+        self.assertEqual(ContentSlug.objects.get_current(category).slug, "another-test")
+
+        article.delete()
+
+        self.assertEqual(
+            list(ContentSlugRegistry.objects.values_list("slug", flat=True)),
+            ["another-test"],
+        )
+
+    def test_rebuild_registry(self):
+        Article.objects.create(title="Quick test")
+        Category.objects.create(name="Another test")
+
+        ContentSlugRegistry.objects.all().delete()
+
+        ContentSlug.objects.rebuild_registry()
+
+        self.assertEqual(ContentSlugRegistry.objects.count(), 2)
+
+
+class RoutingTests(TestCase):
+    def test_reads_use_read_database(self):
+        user = User.objects.create(username="thoas")
+
+        with mock.patch.object(settings, "SLUGGABLE_READ_DATABASE", "replica"):
+            self.assertEqual(UserSlug.objects.filter_by_obj(user).db, "replica")
+            self.assertEqual(UserSlug.objects.filter_by_model(User).db, "replica")
+            self.assertEqual(
+                UserSlug.objects.for_write().filter_by_obj(user).db, "default"
+            )
+
+    def test_read_your_writes(self):
+        user = User.objects.create(username="thoas")
+        other = User.objects.create(username="oleiade")
+
+        with mock.patch.object(
+            settings, "SLUGGABLE_READ_DATABASE", "replica"
+        ), mock.patch.object(
+            settings, "SLUGGABLE_READ_YOUR_WRITES_TIMEOUT", 60
+        ), mock.patch.dict(
+            models._recent_writes, clear=True
+        ):
+            user.username = "florent"
+            user.save()
+
+            self.assertEqual(UserSlug.objects.filter_by_obj(user).db, "default")
+            self.assertEqual(UserSlug.objects.filter_by_obj(other).db, "replica")
+
+            self.assertEqual(UserSlug.objects.get_read_db(slug="florent"), "default")
+            self.assertEqual(UserSlug.objects.get_read_db(slug="Florent"), "default")
+            self.assertEqual(UserSlug.objects.get_read_db(slug="oleiade"), "replica")
+
+            self.assertEqual(UserSlug.objects.resolve("florent").slug, "florent")
+
+    def test_resolve(self):
+        user = User.objects.create(username="thoas")
+        user.username = "oleiade"
+        user.save()
+
+        self.assertEqual(UserSlug.objects.resolve("thoas").slug, "oleiade")
+        self.assertEqual(UserSlug.objects.resolve("oleiade").slug, "oleiade")
+        self.assertIsNone(UserSlug.objects.resolve("florent"))
+
+    def test_resolve_case_variants(self):
+        content_type = ContentType.objects.get_for_model(User)
+
+        for object_id, slug in enumerate(("thoas", "Thoas"), 1):
+            UserSlug.objects.create(
+                content_type=content_type, object_id=object_id, slug=slug
+            )
+
+        self.assertEqual(UserSlug.objects.resolve("thoas").slug, "thoas")
+        self.assertEqual(UserSlug.objects.resolve("Thoas").slug, "Thoas")
+        self.assertEqual(UserSlug.objects.resolve("THOAS").slug, "Thoas")
+
+    def test_reads_are_routed_without_read_database(self):
+        user = User.objects.create(username="thoas")
+
+        self.assertIsNone(UserSlug.objects.filter_by_obj(user)._db)
+        self.assertIsNone(UserSlug.objects.filter_by_model(User)._db)
+
+
+class PrefixTests(TestCase):
+    def test_prefix(self):
+        for username in ("thoas", "thomas", "theo", "oleiade", "tho"):
+            User.objects.create(username=username)
+
+        self.assertEqual(
+            list(UserSlug.objects.prefix("tho").values_list("slug", flat=True)),
+            ["tho", "thoas", "thomas"],
+        )
+
+        page = list(UserSlug.objects.prefix("th", limit=2))
+
+        self.assertEqual([slug.slug for slug in page], ["theo", "tho"])
+
+        page = UserSlug.objects.prefix("th", after=page[-1].slug, limit=2)
+
+        self.assertEqual([slug.slug for slug in page], ["thoas", "thomas"])
+
+        self.assertEqual(UserSlug.objects.filter(redirect=True).prefix("th").count(), 0)
+
+    def test_prefix_is_case_insensitive(self):
+        content_type = ContentType.objects.get_for_model(User)
+
+        for object_id, slug in enumerate(("Thoas", "thomas", "oleiade")):
+            UserSlug.objects.create(
+                content_type=content_type, object_id=object_id, slug=slug
+            )
+
+        page = list(UserSlug.objects.prefix("THO", limit=1))
+
+        self.assertEqual([slug.slug for slug in page], ["Thoas"])
+
+        page = UserSlug.objects.prefix("tho", after=page[-1].slug)
+
+        self.assertEqual([slug.slug for slug in page], ["thomas"])
+
+    def test_prefix_case_variants(self):
+        content_type = ContentType.objects.get_for_model(User)
+
+        for object_id, slug in enumerate(("thoas", "Thoas"), 1):
+            UserSlug.objects.create(
+                content_type=content_type, object_id=object_id, slug=slug
+            )
+
+        page = list(UserSlug.objects.prefix("tho", limit=1))
+
+        self.assertEqual([slug.slug for slug in page], ["Thoas"])
+
+        page = list(UserSlug.objects.prefix("tho", after=page[-1].slug, limit=1))
+
+        self.assertEqual([slug.slug for slug in page], ["thoas"])
+
+        page = UserSlug.objects.prefix("tho", after=page[-1].slug, limit=1)
+
+        self.assertEqual(list(page), [])
+
+    def test_prefix_index(self):
+        self.assertIn(
+            "tests_userslug_b20e34_pfx",
+            [index.name for index in UserSlug._meta.indexes],
+        )
+
+    @isolate_apps("sluggable.tests")
+    def test_prefix_index_is_opt_in(self):
+        class OtherSlug(Slug):
+            class Meta:
+                abstract = False
+
+        self.assertEqual(OtherSlug._meta.indexes, [])
+
+    def test_prefix_partitions(self):
+        Article.objects.create(title="Quick test")
+        Category.objects.create(name="Quick win")
+        Category.objects.create(name="Another test")
+
+        self.assertEqual(
+            [slug.slug for slug in ContentSlug.objects.prefix("quick")],
+            ["quick-test", "quick-win"],
+        )
+        self.assertEqual(
+            [slug.slug for slug in ContentSlug.objects.prefix("quick", limit=1)],
+            ["quick-test"],
+        )
+        self.assertEqual(
+            [
+                slug.slug
+                for slug in ContentSlug.objects.prefix("quick", after="quick-test")
+            ],
+            ["quick-win"],
+        )
+
+
+class ReservationTests(TestCase):
+    def setUp(self):
+        reservations.get_reservation_store.cache_clear()
+
+    def test_reserve(self):
+        User.objects.create(username="thoas")
+
+        self.assertIsNone(UserSlug.objects.reserve("thoas"))
+
+        token = UserSlug.objects.reserve("oleiade")
+
+        self.assertIsNotNone(token)
+        self.assertIsNone(UserSlug.objects.reserve("Oleiade"))
+
+        self.assertFalse(UserSlug.objects.is_slug_available("oleiade"))
+        self.assertTrue(UserSlug.objects.is_slug_available("oleiade", token=token))
+
+        self.assertFalse(UserSlug.objects.release("oleiade", "invalid"))
+        self.assertTrue(UserSlug.objects.release("oleiade", token))
+
+        self.assertTrue(UserSlug.objects.is_slug_available("oleiade"))
+
+    def test_reservation_is_used_on_save(self):
+        token = UserSlug.objects.reserve("florent")
+
+        self.assertEqual(User.objects.create(username="florent").username, "florent-2")
+
+        user = User(username="florent")
+        user.slug_reservation_token = token
+        user.save()
+
+        self.assertEqual(user.username, "florent")
+
+        book_token = BookSlug.objects.reserve("quick-test")
+
+        book = Book.objects.create(title="Quick test", subtitle="Quick test")
+
+        self.assertEqual(book.slug, "quick-test-2")
+        self.assertEqual(book.subtitle_slug, "quick-test-3")
+
+        self.assertTrue(BookSlug.objects.release("quick-test", book_token))
+
+    def test_bulk_rename_reserved_slug(self):
+        poll = Poll.objects.create(question="Quick test")
+
+        token = PollSlug.objects.reserve("renamed")
+
+        with self.assertRaises(IntegrityError):
+            PollSlug.objects.bulk_rename({poll: "renamed"})
+
+        poll.slug_reservation_token = token
+
+        self.assertEqual(PollSlug.objects.bulk_rename({poll: "renamed"}), 1)
+
+    def test_release_requires_token(self):
+        UserSlug.objects.reserve("oleiade")
+
+        self.assertFalse(UserSlug.objects.release("oleiade", None))
+        self.assertFalse(UserSlug.objects.is_slug_available("oleiade"))
+
+    def test_reservation_expires(self):
+        with mock.patch.object(reservations.time, "monotonic", return_value=0):
+            self.assertIsNotNone(UserSlug.objects.reserve("oleiade", ttl=10))
+
+        with mock.patch.object(reservations.time, "monotonic", return_value=11):
+            self.assertTrue(UserSlug.objects.is_slug_available("oleiade"))
+
+    def test_cache_store(self):
+        store = reservations.CacheReservationStore()
+
+        token = store.reserve("thoas", 10)
+
+        self.assertIsNone(store.reserve("thoas", 10))
+        self.assertEqual(store.get("thoas"), token)
+        self.assertFalse(store.release("thoas", None))
+        self.assertFalse(store.release("thoas", "invalid"))
+        self.assertTrue(store.release("thoas", token))
+        self.assertIsNone(store.get("thoas"))
+
+    def test_cache_store_release_is_locked(self):
+        store = reservations.CacheReservationStore()
+
+        token = store.reserve("thoas", 10)
+
+        with store.lock("thoas"), mock.patch.object(reservations.time, "sleep"):
+            self.assertFalse(store.release("thoas", token))
+
+        self.assertEqual(store.get("thoas"), token)
+
+    def test_base_store_is_abstract(self):
+        with self.assertRaises(TypeError):
+            reservations.BaseReservationStore()
+
+
+class BulkRenameTests(TestCase):
+    def test_bulk_rename(self):
+        polls = [Poll.objects.create(question="Poll %d" % i) for i in range(5)]
+
+        polls[0].slug = "renamed"
+        polls[0].save()
+
+        count = PollSlug.objects.bulk_rename(
+            Poll.objects.all(),
+            lambda poll: poll.slug.replace("poll", "question"),
+            chunk_size=2,
+        )
+
+        self.assertEqual(count, 4)
+
+        self.assertEqual(
+            sorted(Poll.objects.values_list("slug", flat=True)),
+            ["question-1", "question-2", "question-3", "question-4", "renamed"],
+        )
+
+        self.assertEqual(PollSlug.objects.filter(redirect=False).count(), 5)
+        self.assertEqual(PollSlug.objects.filter(redirect=True).count(), 5)
+
+        slug = PollSlug.objects.get(slug="poll-1")
+
+        self.assertEqual(slug.current.slug, "question-1")
+
+    def test_bulk_rename_restores_previous_slug(self):
+        poll = Poll.objects.create(question="Quick test")
+        poll.slug = "another-test"
+        poll.save()
+
+        with self.assertNumQueries(6):
+            PollSlug.objects.bulk_rename({poll: "quick-test"})
+
+        self.assertEqual(PollSlug.objects.get_current(poll).slug, "quick-test")
+        self.assertEqual(PollSlug.objects.count(), 2)
+
+    def test_bulk_rename_collision(self):
+        Poll.objects.create(question="Quick test")
+        poll = Poll.objects.create(question="Another test")
+
+        with self.assertRaises(IntegrityError):
+            PollSlug.objects.bulk_rename({poll: "quick-test"})
+
+        poll.refresh_from_db()
+
+        self.assertEqual(poll.slug, "another-test")
+        self.assertEqual(PollSlug.objects.get_current(poll).slug, "another-test")
+
+
+class ExportImportTests(TestCase):
+    def test_export_import(self):
+        poll = Poll.objects.create(question="Quick test")
+        poll.slug = "another-test"
+        poll.save()
+
+        user = User.objects.create(username="thoas")
+
+        created = PollSlug.objects.get(slug="quick-test").created
+
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "slugs.jsonl.gz")
+
+            call_command(
+                "sluggable_export", "tests.PollSlug", output=filename, stdout=StringIO()
+            )
+
+            PollSlug.objects.all().delete()
+
+            call_command(
+                "sluggable_import", "tests.UserSlug", input=filename, stdout=StringIO()
+            )
+
+        self.assertEqual(UserSlug.objects.count(), 3)
+
+        slug = UserSlug.objects.get(slug="quick-test")
+
+        self.assertTrue(slug.redirect)
+        self.assertEqual(slug.created, created)
+        self.assertEqual(slug.content_object, poll)
+        self.assertEqual(slug.current.slug, "another-test")
+        self.assertEqual(UserSlug.objects.get_current(user).slug, "thoas")
+
+    def test_import_conflicts(self):
+        Poll.objects.create(question="Quick test")
+        Poll.objects.create(question="Another test")
+
+        created = PollSlug.objects.get(slug="quick-test").created
+
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "slugs.jsonl")
+
+            call_command(
+                "sluggable_export", "tests.PollSlug", output=filename, stdout=StringIO()
+            )
+
+            PollSlug.objects.filter(slug="another-test").delete()
+
+            with self.assertRaises(CommandError):
+                call_command(
+                    "sluggable_import",
+                    "tests.PollSlug",
+                    input=filename,
+                    stdout=StringIO(),
+                )
+
+            stdout = StringIO()
+
+            call_command(
+                "sluggable_import",
+                "tests.PollSlug",
+                input=filename,
+                ignore_conflicts=True,
+                stdout=stdout,
+            )
+
+            self.assertIn("Imported 1 slugs", stdout.getvalue())
+
+            stdout = StringIO()
+
+            call_command(
+                "sluggable_import",
+                "tests.PollSlug",
+                input=filename,
+                ignore_conflicts=True,
+                stdout=stdout,
+            )
+
+            self.assertIn("Imported 0 slugs", stdout.getvalue())
+
+        self.assertEqual(PollSlug.objects.count(), 2)
+        self.assertEqual(PollSlug.objects.get(slug="quick-test").created, created)
+        self.assertTrue(PollSlug._meta.get_field("created").auto_now_add)
+
+    def test_export_to_stdout(self):
+        Poll.objects.create(question="Quick test")
+
+        out = StringIO()
+
+        call_command("sluggable_export", "tests.PollSlug", stdout=out)
+
+        lines = out.getvalue().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[0],
+            '{"content_type":[%d,"tests","poll"]}'
+            % ContentType.objects.get_for_model(Poll).pk,
+        )
+
+
+class ProfilingTests(SlugQueriesTestMixin, TestCase):
+    def test_profile_slug_queries(self):
+        poll = Poll.objects.create(question="Quick test")
+
+        with profile_slug_queries() as profile:
+            poll.slug = "another-test"
+            poll.save()
+
+        summary = profile.summary()
+
+        self.assertEqual(summary["generate_unique_slug"]["count"], 1)
+        self.assertEqual(summary["update_slug"]["count"], 4)
+        self.assertEqual(summary[None]["count"], 1)
+
+        self.assertIn("update_slug", profile.report())
+
+    def test_assert_max_slug_queries(self):
+        with self.assertMaxSlugQueries(1, call_site="generate_unique_slug"):
+            Poll.objects.create(question="Quick test")
+
+        with self.assertRaises(AssertionError):
+            with self.assertMaxSlugQueries(1):
+                Poll.objects.create(question="Quick test")
+
+
+class GenerateUniqueSlugsTests(TestCase):
+    def test_same_slugs_as_field(self):
+        questions = ["Quick test", "Quick test", "Another test", "a" * 60] + [
+            "b" * 60
+        ] * 11
+
+        Poll.objects.create(question="Another test")
+
+        existing = list(PollSlug.objects.values_list("slug", flat=True))
+
+        slugs = generate_unique_slugs(questions, existing)
+
+        expected = [
+            Poll.objects.create(question=question).slug for question in questions
+        ]
+
+        self.assertEqual(slugs, expected)
+        self.assertEqual(slugs[-1], "b" * 47 + "-11")
+
+    def test_case_sensitive(self):
+        Poll.objects.create(question="thoas")
+
+        existing = list(PollSlug.objects.values_list("slug", flat=True))
+
+        self.assertEqual(
+            generate_unique_slugs(["Thoas"], existing, slugify=str),
+            [
+                PollSlug.objects.generate_unique_slug(
+                    Poll(question="Thoas"), "Thoas", 50, "-"
+                )
+            ],
+        )
+        self.assertEqual(
+            generate_unique_slugs(["Thoas"], existing, slugify=str), ["Thoas"]
+        )
+        self.assertEqual(
+            generate_unique_slugs(
+                ["thoas", "Thoas"], slugify=str, case_sensitive=False
+            ),
+            ["thoas", "Thoas-2"],
+        )
+        self.assertEqual(
+            generate_unique_slugs(["", "thoas"], ["thoas"]), [None, "thoas-2"]
+        )
+
+
+class ConsistencyTests(TestCase):
+    def test_check_and_repair(self):
+        polls = [Poll.objects.create(question="Poll %d" % i) for i in range(5)]
+
+        content_type = ContentType.objects.get_for_model(Poll)
+
+        # mismatch
+        Poll.objects.filter(pk=polls[0].pk).update(slug="renamed")
+        # missing
+        PollSlug.objects.filter_by_obj(polls[1]).delete()
+        # multiple
+        PollSlug.objects.create(
+            content_type=content_type, object_id=polls[2].pk, slug="another"
+        )
+        # orphaned
+        PollSlug.objects.create(
+            content_type=content_type, object_id=polls[4].pk + 1, slug="orphan"
+        )
+
+        out = StringIO()
+
+        call_command("sluggable_check", "tests.Poll", stdout=out)
+
+        self.assertEqual(
+            out.getvalue(),
+            "tests.Poll.slug: 1 missing, 1 multiple, 1 mismatch, 1 orphaned\n",
+        )
+
+        call_command(
+            "sluggable_check",
+            "tests.Poll",
+            repair=True,
+            batch_size=1,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(PollSlug.objects.get_current(polls[0]).slug, "renamed")
+        self.assertTrue(PollSlug.objects.get(slug="poll-0").redirect)
+        self.assertEqual(PollSlug.objects.get_current(polls[1]).slug, "poll-1")
+        self.assertEqual(PollSlug.objects.get_current(polls[2]).slug, "poll-2")
+        self.assertFalse(PollSlug.objects.filter(slug="orphan").exists())
+
+        out = StringIO()
+
+        call_command("sluggable_check", stdout=out, stderr=StringIO())
+
+        self.assertIn(
+            "tests.Poll.slug: 0 missing, 0 multiple, 0 mismatch, 0 orphaned",
+            out.getvalue(),
+        )
+
+    def test_shared_decider_is_skipped(self):
+        Book.objects.create(title="Quick test", subtitle="Another test")
+
+        out = StringIO()
+        err = StringIO()
+
+        call_command("sluggable_check", "tests.Book", stdout=out, stderr=err)
+
+        self.assertEqual(out.getvalue(), "")
+        self.assertIn(
+            "tests.Book.subtitle_slug: skipped, tests.BookSlug is shared",
+            err.getvalue(),
+        )
+
+        with self.assertRaises(ValueError):
+            list(iter_inconsistencies(Book, Book._meta.get_field("slug")))
+
+
+class MultipleFieldsTests(SlugQueriesTestMixin, TestCase):
+    def test_single_pass(self):
+        BookSlug.objects.create(
+            content_type=ContentType.objects.get_for_model(Poll),
+            object_id=1,
+            slug="quick-test",
+        )
+
+        with self.assertMaxSlugQueries(1, call_site="get_used_slugs"):
+            book = Book.objects.create(title="Another test", subtitle="Last test")
+
+        self.assertEqual(book.slug, "another-test")
+        self.assertEqual(book.subtitle_slug, "last-test")
+
+        book = Book.objects.create(title="Quick test", subtitle="Quick test")
+
+        self.assertEqual(book.slug, "quick-test-2")
+        self.assertEqual(book.subtitle_slug, "quick-test-3")
+
+    def test_get_current(self):
+        with mock.patch.object(
+            BookSlug.objects, "update_slug", wraps=BookSlug.objects.update_slug
+        ) as update_slug:
+            book = Book.objects.create(title="Quick test", subtitle="Another test")
+
+        self.assertEqual(update_slug.call_count, 1)
+
+        self.assertEqual(BookSlug.objects.filter_by_obj(book).count(), 2)
+        self.assertEqual(BookSlug.objects.get_current(book).slug, "quick-test")
+        self.assertEqual(BookSlug.objects.resolve("another-test").slug, "quick-test")
+
+        book.subtitle = "Last test"
+        book.subtitle_slug = None
+        book.save()
+
+        self.assertEqual(book.subtitle_slug, "last-test")
+        self.assertEqual(BookSlug.objects.filter_by_obj(book).count(), 3)
+        self.assertEqual(BookSlug.objects.get_current(book).slug, "quick-test")
+
+        book.title = "Renamed"
+        book.slug = None
+        book.save()
+
+        self.assertEqual(
+            BookSlug.objects.filter_by_obj(book, redirect=False).get().slug,
+            "renamed",
+        )
+
+    def test_bulk_rename_shared_decider(self):
+        book = Book.objects.create(title="Quick test", subtitle="Another test")
+
+        with self.assertRaises(ValueError):
+            BookSlug.objects.bulk_rename({book: "renamed"}, field_name="subtitle_slug")
+
+        BookSlug.objects.bulk_rename({book: "renamed"}, field_name="slug")
+
+        self.assertEqual(BookSlug.objects.get_current(book).slug, "renamed")
+
+    def test_delete_once_per_decider(self):
+        book = Book.objects.create(title="Quick test", subtitle="Another test")
+
+        with self.assertMaxSlugQueries(1, call_site="instance_post_delete"):
+            book.delete()
+
+        self.assertEqual(BookSlug.objects.count(), 0)
+
+
+class HashedSlugTests(TestCase):
+    def test_slug_hash(self):
+        tag = Tag.objects.create(name="Quick test")
+
+        slug = TagSlug.objects.get(slug="quick-test")
+
+        self.assertEqual(slug.slug_hash, get_slug_hash("quick-test"))
+        self.assertEqual(get_slug_hash("Quick-Test"), get_slug_hash("quick-test"))
+
+        self.assertEqual(Tag.objects.create(name="Quick test").slug, "quick-test-2")
+
+        self.assertFalse(TagSlug.objects.is_slug_available("Quick-test"))
+        self.assertTrue(TagSlug.objects.is_slug_available("quick-test", obj=tag))
+        self.assertEqual(TagSlug.objects.resolve("quick-test"), slug)
+
+    def test_uniqueness_through_slug_hash(self):
+        field = TagSlug._meta.get_field("slug")
+
+        self.assertFalse(field.unique or field.db_index)
+        self.assertTrue(TagSlug._meta.get_field("slug_hash").unique)
+
+        tag = Tag.objects.create(name="Quick test")
+
+        with self.assertRaises(IntegrityError):
+            TagSlug.objects.create(
+                content_type=ContentType.objects.get_for_model(Tag),
+                object_id=tag.pk + 1,
+                slug="quick-test",
+            )
+
+    def test_case_variant(self):
+        Tag.objects.create(name="thoas")
+
+        tag = Tag.objects.create(name="Another test")
+
+        self.assertEqual(TagSlug.objects.get_used_slugs(["Thoas"]), {"Thoas"})
+
+        slug = TagSlug.objects.generate_unique_slug(tag, "Thoas", 255, "-")
+
+        self.assertEqual(slug, "Thoas-2")
+
+        TagSlug.objects.update_slug(tag, slug)
+
+        self.assertEqual(TagSlug.objects.get_current(tag).slug, "Thoas-2")
+
+    def test_lookups_use_slug_hash(self):
+        self.assertIn(
+            "slug_hash", str(TagSlug.objects.filter_by_slug("quick-test").query)
+        )
+        self.assertIn(
+            "slug_hash", str(TagSlug.objects.filter_by_slugs(["quick-test"]).query)
+        )
+        self.assertNotIn(
+            "slug_hash", str(PollSlug.objects.filter_by_slug("quick-test").query)
+        )
+
+    def test_bulk_rename(self):
+        tag = Tag.objects.create(name="Quick test")
+
+        TagSlug.objects.bulk_rename({tag: "another-test"})
+
+        self.assertEqual(
+            TagSlug.objects.get(slug="another-test").slug_hash,
+            get_slug_hash("another-test"),
+        )
+
+
+class SingleFlightTests(TestCase):
+    def test_concurrent_calls_are_coalesced(self):
+        single_flight = cache.SingleFlight()
+
+        started = threading.Event()
+        barrier = threading.Barrier(10)
+
+        calls = []
+        results = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            # wait for the other callers to join the flight
+            barrier.wait()
+            time.sleep(0.05)
+            return "quick-test"
+
+        def leader():
+            results.append(single_flight.do("quick-test", func))
+
+        def follower():
+            started.wait()
+            barrier.wait()
+            results.append(single_flight.do("quick-test", func))
+
+        threads = [threading.Thread(target=leader)] + [
+            threading.Thread(target=follower) for i in range(9)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["quick-test"] * 10)
+        self.assertEqual(single_flight._calls, {})
+
+
+@mock.patch.object(settings, "SLUGGABLE_RESOLVE_CACHE", "default")
+class ResolveCacheTests(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_resolve_is_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create(username="thoas")
+
+        self.assertEqual(UserSlug.objects.resolve("thoas").slug, "thoas")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(UserSlug.objects.resolve("thoas").slug, "thoas")
+            self.assertEqual(UserSlug.objects.get_current(user).slug, "thoas")
+
+    def test_rename_writes_through(self):
+        user = User.objects.create(username="thoas")
+
+        UserSlug.objects.resolve("thoas")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.username = "oleiade"
+            user.save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(UserSlug.objects.resolve("thoas").slug, "oleiade")
+            self.assertEqual(UserSlug.objects.resolve("oleiade").slug, "oleiade")
+            self.assertEqual(UserSlug.objects.get_current(user).slug, "oleiade")
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            user.delete()
+
+        # invalidated once the deletion is committed
+        self.assertEqual(UserSlug.objects.resolve("thoas").slug, "oleiade")
+
+        for callback in callbacks:
+            callback()
+
+        self.assertIsNone(UserSlug.objects.resolve("thoas"))
+
+    def test_rollback_does_not_write_through(self):
+        user = User.objects.create(username="thoas")
+
+        UserSlug.objects.resolve("thoas")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    user.username = "oleiade"
+                    user.save()
+
+                    raise IntegrityError
+            except IntegrityError:
+                pass
+
+        self.assertEqual(UserSlug.objects.resolve("thoas").slug, "thoas")
+        self.assertIsNone(UserSlug.objects.resolve("oleiade"))
+
+    def test_partition_writes_through_once(self):
+        article = Article.objects.create(title="Quick test")
+
+        with mock.patch.object(cache, "set_many") as set_many:
+            with self.captureOnCommitCallbacks(execute=True):
+                article.slug = "renamed"
+                article.save()
+
+        self.assertEqual(set_many.call_count, 1)
+        self.assertIn(
+            ContentSlug.objects._get_resolve_cache_key("renamed"),
+            set_many.call_args[0][0],
+        )
+
+    def test_stale_while_revalidate(self):
+        User.objects.create(username="thoas")
+
+        with mock.patch.object(cache.time, "time", return_value=0):
+            UserSlug.objects.resolve("thoas")
+
+        with mock.patch.object(cache.time, "time", return_value=100):
+            caches["default"].add(
+                "%s:refresh" % UserSlug.objects._get_resolve_cache_key("thoas"), 1
+            )
+
+            # another caller is refreshing, the stale value is served
+            with self.assertNumQueries(0):
+                self.assertEqual(UserSlug.objects.resolve("thoas").slug, "thoas")
+
+            caches["default"].clear()
+
+
+@override_settings(
+    ROOT_URLCONF="sluggable.tests.urls",
+    MIDDLEWARE=["sluggable.middleware.SlugRedirectMiddleware"],
+)
+@mock.patch.object(
+    settings,
+    "SLUGGABLE_REDIRECT_URLS",
+    {"user_detail": ("tests.UserSlug", "username")},
+)
+class RedirectMiddlewareTests(TestCase):
+    def test_get_canonical_slug(self):
+        user = User.objects.create(username="thoas")
+
+        for username in ("oleiade", "florent"):
+            user.username = username
+            user.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(UserSlug.objects.get_canonical_slug("thoas"), "florent")
+
+        self.assertEqual(UserSlug.objects.get_canonical_slug("florent"), "florent")
+        self.assertIsNone(UserSlug.objects.get_canonical_slug("unknown"))
+
+    def test_get_canonical_slug_is_indexed(self):
+        for decider in (UserSlug, TagSlug):
+            self.assertIn(
+                ["content_type", "object_id", "redirect"],
+                [index.fields for index in decider._meta.indexes],
+            )
+
+        query = str(UserSlug.objects.filter_by_slug("Thoas", iexact=True).query)
+
+        self.assertIn('LOWER("tests_userslug"."slug") = thoas', query)
+
+    def test_redirect(self):
+        user = User.objects.create(username="thoas")
+        user.username = "oleiade"
+        user.save()
+
+        response = self.client.get("/users/thoas/?page=2")
+
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response["Location"], "/users/oleiade/?page=2")
+
+        self.assertEqual(self.client.get("/users/oleiade/").status_code, 200)
+        self.assertEqual(self.client.get("/users/unknown/").status_code, 404)
+
+
+class LoadTestTests(TestCase):
+    def test_requires_shared_database(self):
+        with self.assertRaises(CommandError):
+            call_command("sluggable_loadtest", "tests.Poll", stdout=StringIO())
+
+    def test_malformed_mix(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "sluggable_loadtest", "tests.Poll", mix="create", stdout=StringIO()
+            )
+
+    def test_run(self):
+        manage = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "manage.py"
+        )
+
+        with tempfile.TemporaryDirectory() as path:
+            env = dict(
+                os.environ,
+                DJANGO_SETTINGS_MODULE="sluggable.tests.settings_loadtest",
+                SLUGGABLE_LOADTEST_DATABASE=os.path.join(path, "loadtest.sqlite3"),
+            )
+
+            subprocess.run(
+                [sys.executable, manage, "migrate", "--noinput", "-v", "0"],
+                env=env,
+                check=True,
+            )
+
+            # a single worker has no race, every invariant must hold
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    manage,
+                    "sluggable_loadtest",
+                    "tests.Poll",
+                    "--workers=1",
+                    "--operations=100",
+                    "--seed=4",
+                ],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+
+        lines = output.splitlines()
+
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(
+            lines[0].split(),
+            [
+                "operation",
+                "count",
+                "p50",
+                "ms",
+                "p99",
+                "ms",
+                "queries",
+                "integ.",
+                "errors",
+            ],
+        )
+
+        for line, name in zip(lines[1:5], ("create", "rename", "delete", "resolve")):
+            self.assertRegex(line, r"^%s +\d+ +[\d.]+ +[\d.]+ +[\d.]+ +0 +0$" % name)
+
+        self.assertRegex(
+            lines[5], r"^100 operations in [\d.]+s, [\d.]+ ops/s \(seed 4\)$"
+        )
+        self.assertEqual(
+            lines[6],
+            "invariant violations: 0 missing, 0 multiple, 0 mismatch, "
+            "0 orphaned, 0 duplicate slugs",
+        )
+
+        # the model rows are deleted by the command, sluggable deletes the slugs
+        self.assertRegex(lines[3], r" 1\.00 +0 +0$")
+
+    def test_unknown_operation(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "sluggable_loadtest", "tests.Poll", mix="update=1", stdout=StringIO()
+            )
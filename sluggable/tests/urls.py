@@ -0,0 +1,7 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("users/<slug:username>/", views.user_detail, name="user_detail"),
+]
@@ -0,0 +1,10 @@
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+
+from .models import User
+
+
+def user_detail(request, username):
+    user = get_object_or_404(User, username=username)
+
+    return HttpResponse(user.username)
@@ -1,7 +1,11 @@
 from __future__ import unicode_literals
 
+import hashlib
+
 from django.db import models
 
+from . import settings
+
 
 def get_obj_id(obj):
     obj_id = obj
@@ -23,6 +27,19 @@ def get_prepopulated_value(instance, populate_from):
     return callable(attr) and attr() or attr
 
 
+def get_slug_hash(slug):
+    """
+    Returns a signed 64-bit digest of ``slug``, lowercased unless slugs
+    are case sensitive.
+    """
+    if not settings.SLUGGABLE_CASE_SENSITIVE:
+        slug = slug.lower()
+
+    digest = hashlib.blake2b(slug.encode("utf-8"), digest_size=8).digest()
+
+    return int.from_bytes(digest, "big", signed=True)
+
+
 def crop_slug(slug, max_length):
     if max_length < len(slug):
         return slug[:max_length]
@@ -30,28 +47,19 @@ def crop_slug(slug, max_length):
     return slug
 
 
-def generate_unique_slug(qs, instance, slug, max_length, field_name, index_sep):
+def iter_slug_candidates(slug, max_length, index_sep):
     """
-    Generates unique slug by adding a number to given value until no model
-    instance can be found with such slug. If ``unique_with`` (a tuple of field
-    names) was specified for the field, all these fields are included together
-    in the query when looking for a "rival" model instance.
+    Yields ``slug`` then its variants suffixed by an increasing index, all
+    cropped to ``max_length``.
     """
 
     original_slug = slug = crop_slug(slug, max_length)
 
     index = 1
 
-    # keep changing the slug until it is unique
     while True:
-        # find instances with same slug
-        rivals = qs.filter(**{field_name: slug}).exclude(pk=instance.pk)
+        yield slug
 
-        if not rivals:
-            # the slug is unique, no model uses it
-            return slug
-
-        # the slug is not unique; change once more
         index += 1
 
         # ensure the resulting string is not too long
@@ -65,4 +73,109 @@ def generate_unique_slug(qs, instance, slug, max_length, field_name, index_sep):
 
         slug = "%(slug)s%(sep)s%(index)d" % data
 
-    return slug
+
+def exclude_instance(qs, instance):
+    """
+    Excludes ``instance`` from ``qs`` if it is a queryset of its model,
+    querysets of deciders exclude the slugs of the instance themselves.
+    """
+    if isinstance(instance, qs.model):
+        return qs.exclude(pk=instance.pk)
+
+    return qs
+
+
+def generate_unique_slug(
+    qs,
+    instance,
+    slug,
+    max_length,
+    field_name,
+    index_sep,
+    filter_func=None,
+    is_reserved=None,
+):
+    """
+    Generates unique slug by adding a number to given value until no model
+    instance can be found with such slug. If ``unique_with`` (a tuple of field
+    names) was specified for the field, all these fields are included together
+    in the query when looking for a "rival" model instance.
+
+    ``qs`` can also be a list of querysets, the slug must then be unique
+    across all of them. ``filter_func(qs, slug)`` replaces the lookup on
+    ``field_name``, slugs for which ``is_reserved(slug)`` is true are skipped.
+    """
+
+    if isinstance(qs, (list, tuple)):
+        querysets = qs
+    else:
+        querysets = [qs]
+
+    if filter_func is None:
+
+        def filter_func(qs, slug):
+            return qs.filter(**{field_name: slug})
+
+    # keep changing the slug until it is unique
+    for slug in iter_slug_candidates(slug, max_length, index_sep):
+        if is_reserved is not None and is_reserved(slug):
+            continue
+
+        # find instances with same slug
+        rivals = any(
+            exclude_instance(filter_func(qs, slug), instance).exists()
+            for qs in querysets
+        )
+
+        if not rivals:
+            # the slug is unique, no model uses it
+            return slug
+
+
+def generate_unique_slugs(
+    values,
+    existing=(),
+    max_length=50,
+    index_sep=None,
+    slugify=None,
+    case_sensitive=True,
+):
+    """
+    Returns unique slugs for ``values`` as ``SluggableField`` would generate
+    them when saving objects in this order, without querying the database.
+
+    ``existing`` contains slugs already used, empty values give ``None``.
+    Slugs are compared exactly like ``SluggableField`` does, pass
+    ``case_sensitive=False`` to also reject slugs differing only by case.
+    """
+    if index_sep is None:
+        index_sep = settings.SLUGGABLE_SEPARATOR
+
+    if slugify is None:
+        slugify = settings.slugify
+
+    if case_sensitive:
+        normalize = str
+    else:
+        normalize = str.lower
+
+    taken = set(normalize(slug) for slug in existing)
+
+    results = []
+
+    for value in values:
+        if not value:
+            results.append(None)
+            continue
+
+        slug = crop_slug(slugify(value), max_length)
+
+        for slug in iter_slug_candidates(slug, max_length, index_sep):
+            if normalize(slug) not in taken:
+                break
+
+        taken.add(normalize(slug))
+
+        results.append(slug)
+
+    return results